@@ -14,6 +14,12 @@ from pydantic import BaseModel, validator
 from .logger import get_logger, log_function_call
 from .config import CleanerConfig, FieldValidation
 
+# str.translate deletion table: C0 controls except \t and \n, DEL and C1 controls
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [i for i in range(32) if i not in (9, 10)] + list(range(0x7f, 0xa0)),
+    None
+)
+
 
 class ValidationError(Exception):
     """Raised when data validation fails."""
@@ -143,7 +149,7 @@ class DataCleaner:
             cleaned = cleaned.replace('  ', ' ')
         
         # Remove control characters except newlines and tabs
-        cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in '\n\t')
+        cleaned = cleaned.translate(_CONTROL_CHARS_TABLE)
         
         return cleaned
     
@@ -57,6 +57,10 @@ class TargetConfig(BaseModel):
     pagination: Optional[PaginationConfig] = None
     js_render: bool = False
     rate_limit: Optional[float] = None
+    parser: str = Field(default="lxml", pattern="^(lxml|lxml-xpath|html\\.parser|selectolax)$")
+    max_concurrency: int = Field(default=8, ge=1)
+    # Expected URL count for Bloom-filter dedup of large crawls (exact set if None)
+    bloom_capacity: Optional[int] = Field(default=None, ge=1)
 
     @validator('pagination')
     def validate_pagination(cls, v, values):
@@ -109,6 +113,9 @@ class SQLiteConfig(BaseModel):
     """SQLite storage configuration."""
     database_url: str = "sqlite:///./data/output/hex_processor.db"
     table_name: str = "scraped_data"
+    commit_batch_size: int = Field(default=1, ge=1)
+    commit_interval: float = Field(default=1.0, gt=0)
+    synchronous: str = Field(default="NORMAL", pattern="^(OFF|NORMAL|FULL|EXTRA)$")
 
 
 class StorageConfig(BaseModel):
@@ -151,6 +158,9 @@ class WebhookConfig(BaseModel):
     timeout: int = 10
     on_success: bool = True
     on_error: bool = True
+    batch_enabled: bool = False
+    max_batch: int = Field(default=50, ge=1)
+    max_wait_ms: int = Field(default=500, ge=0)
 
 
 class NotificationsConfig(BaseModel):
@@ -5,6 +5,7 @@ Provides retry logic, rate limiting, and error handling for web requests.
 """
 
 import asyncio
+import os
 import random
 import time
 import logging
@@ -22,6 +23,12 @@ from tenacity import (
 
 from .logger import get_logger, log_async_function_call
 
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class HTTPClient:
     """Async HTTP client with retry logic and rate limiting."""
@@ -34,7 +41,12 @@ class HTTPClient:
         user_agent: str = "HEX-Data-Processor/1.0",
         headers: Optional[Dict[str, str]] = None,
         proxies: Optional[Dict[str, str]] = None,
-        follow_redirects: bool = True
+        follow_redirects: bool = True,
+        max_concurrent: int = 10,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None
     ):
         """
         Initialize HTTP client.
@@ -47,6 +59,13 @@ class HTTPClient:
             headers: Additional headers
             proxies: Proxy configuration
             follow_redirects: Whether to follow redirects
+            max_concurrent: Default concurrency for fetch_multiple
+            http2: Enable HTTP/2 (env HTTPX_HTTP2, default on when h2 is installed)
+            max_connections: Connection pool size (env HTTPX_MAX_CONNECTIONS, default 100)
+            max_keepalive_connections: Idle connections kept open
+                (env HTTPX_MAX_KEEPALIVE_CONNECTIONS, default 20)
+            keepalive_expiry: Seconds before idle connections close
+                (env HTTPX_KEEPALIVE_EXPIRY, default 30)
         """
         self.timeout = timeout
         self.max_retries = max_retries
@@ -55,6 +74,18 @@ class HTTPClient:
         self.headers = headers or {}
         self.proxies = proxies
         self.follow_redirects = follow_redirects
+        self.max_concurrent = max_concurrent
+        
+        if http2 is None:
+            http2 = os.getenv("HTTPX_HTTP2", "true").lower() in ("1", "true", "yes")
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.limits = httpx.Limits(
+            max_connections=max_connections or int(os.getenv("HTTPX_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=max_keepalive_connections or int(
+                os.getenv("HTTPX_MAX_KEEPALIVE_CONNECTIONS", "20")
+            ),
+            keepalive_expiry=keepalive_expiry or float(os.getenv("HTTPX_KEEPALIVE_EXPIRY", "30"))
+        )
         
         self.logger = get_logger(__name__)
         
@@ -81,14 +112,19 @@ class HTTPClient:
         await self.close()
     
     async def _ensure_client(self):
-        """Ensure HTTP client is initialized."""
+        """Ensure HTTP client is initialized (one pooled client per instance)."""
         if self._client is None or self._client.is_closed:
             timeout_config = httpx.Timeout(self.timeout)
+            client_kwargs = {}
+            if self.proxies:
+                client_kwargs["proxies"] = self.proxies
             self._client = httpx.AsyncClient(
                 timeout=timeout_config,
                 headers=self.default_headers,
-                proxies=self.proxies,
-                follow_redirects=self.follow_redirects
+                follow_redirects=self.follow_redirects,
+                http2=self.http2,
+                limits=self.limits,
+                **client_kwargs
             )
     
     async def close(self):
@@ -216,7 +252,7 @@ class HTTPClient:
         self,
         urls: List[str],
         method: str = "GET",
-        max_concurrent: int = 10,
+        max_concurrent: Optional[int] = None,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """
@@ -225,13 +261,13 @@ class HTTPClient:
         Args:
             urls: List of URLs to fetch
             method: HTTP method
-            max_concurrent: Maximum concurrent requests
+            max_concurrent: Maximum concurrent requests (defaults to client setting)
             **kwargs: Additional fetch arguments
             
         Returns:
             List of response dictionaries
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent)
         
         async def fetch_with_semaphore(url: str) -> Dict[str, Any]:
             async with semaphore:
@@ -270,6 +306,9 @@ class HTTPClient:
             "user_agent": self.user_agent,
             "headers": self.headers,
             "proxies": self.proxies,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
             "client_closed": self._client.is_closed if self._client else True
         }
 
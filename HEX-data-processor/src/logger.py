@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 
@@ -46,7 +47,11 @@ class StructuredFormatter(logging.Formatter):
             }:
                 log_entry[key] = value
         
-        return json.dumps(log_entry, default=str, ensure_ascii=False)
+        try:
+            return orjson.dumps(log_entry, default=str).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which orjson rejects
+            return json.dumps(log_entry, default=str, ensure_ascii=False)
 
 
 class TextFormatter(logging.Formatter):
@@ -10,7 +10,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
-from .config import Config, load_config
+from .config import Config, SQLiteConfig, load_config
 from .logger import setup_logging, get_logger
 from .http_client import HTTPClient
 from .scraper import Scraper
@@ -105,12 +105,14 @@ class DataProcessor:
                 ensure_ascii=storage_config.jsonl.ensure_ascii if storage_config.jsonl else False
             )
         elif storage_config.type == "sqlite":
-            database_url = storage_config.sqlite.database_url if storage_config.sqlite else "sqlite:///./data/output/hex_processor.db"
-            table_name = storage_config.sqlite.table_name if storage_config.sqlite else "scraped_data"
+            sqlite_config = storage_config.sqlite or SQLiteConfig()
             self.storage = create_storage_adapter(
                 "sqlite",
-                database_url=database_url,
-                table_name=table_name
+                database_url=sqlite_config.database_url,
+                table_name=sqlite_config.table_name,
+                commit_batch_size=sqlite_config.commit_batch_size,
+                commit_interval=sqlite_config.commit_interval,
+                synchronous=sqlite_config.synchronous
             )
         else:
             raise ValueError(f"Unsupported storage type: {storage_config.type}")
@@ -355,6 +357,9 @@ class DataProcessor:
         if self.storage:
             await self.storage.close()
         
+        if self.notifier:
+            await self.notifier.aclose()
+        
         self.logger.info("Cleanup completed")
     
     def get_system_info(self) -> Dict[str, Any]:
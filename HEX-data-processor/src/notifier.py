@@ -5,14 +5,18 @@ Supports Telegram, Email, and Webhook notifications.
 """
 
 import os
+import random
 import smtplib
 import asyncio
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Tuple
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 from .logger import get_logger, log_async_function_call
@@ -21,6 +25,84 @@ from .config import NotificationsConfig
 # Load environment variables
 load_dotenv()
 
+# Dedicated, size-capped pool for blocking SMTP sends
+SMTP_MAX_WORKERS = 5
+_SMTP_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_smtp_executor() -> ThreadPoolExecutor:
+    """Get the shared SMTP executor, creating it on first use."""
+    global _SMTP_EXECUTOR
+    if _SMTP_EXECUTOR is None:
+        _SMTP_EXECUTOR = ThreadPoolExecutor(
+            max_workers=SMTP_MAX_WORKERS,
+            thread_name_prefix='smtp'
+        )
+    return _SMTP_EXECUTOR
+
+
+def _shutdown_smtp_executor():
+    """Shut down the shared SMTP executor if it was started."""
+    global _SMTP_EXECUTOR
+    if _SMTP_EXECUTOR is not None:
+        _SMTP_EXECUTOR.shutdown(wait=True)
+        _SMTP_EXECUTOR = None
+
+
+# Transient failures worth retrying; everything else fails immediately
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_RETRYABLE_EXCEPTIONS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a send error is transient."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, _RETRYABLE_EXCEPTIONS)
+
+
+async def _retry(
+    fn: Callable[[], Awaitable[Any]],
+    attempts: int = 3,
+    base: float = 0.25,
+    logger=None
+) -> Any:
+    """
+    Await fn(), retrying transient errors with jittered exponential backoff.
+    
+    Args:
+        fn: Zero-argument callable returning an awaitable
+        attempts: Maximum number of attempts
+        base: Base delay in seconds
+        logger: Optional logger for retry warnings
+        
+    Returns:
+        Result of the first successful attempt
+    """
+    for attempt in range(attempts):
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_retryable(e):
+                raise
+            delay = base * 2 ** attempt + random.uniform(0, base)
+            if logger:
+                logger.warning(
+                    f"Transient notification error, retrying in {delay:.2f}s: {str(e)}"
+                )
+            await asyncio.sleep(delay)
+
+
+# Static parts of webhook payloads; dynamic fields are merged per send
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_SUCCESS_PAYLOAD_STATIC = {'event': 'processing_completed', 'status': 'success'}
+_ERROR_PAYLOAD_STATIC = {'event': 'processing_failed', 'status': 'error'}
+
 
 class NotificationError(Exception):
     """Raised when notification fails."""
@@ -59,9 +141,12 @@ class TelegramNotifier:
             }
             
             async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=data)
-                response.raise_for_status()
+                async def _post():
+                    response = await client.post(url, json=data)
+                    response.raise_for_status()
+                    return response
                 
+                response = await _retry(_post, logger=self.logger)
                 result = response.json()
                 if result.get("ok"):
                     self.logger.info("Telegram message sent successfully")
@@ -156,24 +241,14 @@ class EmailNotifier:
             # Add body
             msg.attach(MIMEText(body, 'html'))
             
-            # Send email in thread pool
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, self._send_sync, msg)
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Failed to send email: {str(e)}")
-            return False
-    
-    def _send_sync(self, msg: MIMEMultipart) -> bool:
-        """Synchronous email sending."""
-        try:
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                
-                server.login(self.username, self.password)
-                server.send_message(msg)
+            # Send email in the dedicated SMTP thread pool; each retry
+            # opens a fresh connection
+            loop = asyncio.get_running_loop()
+            executor = _get_smtp_executor()
+            await _retry(
+                lambda: loop.run_in_executor(executor, self._send_sync, msg),
+                logger=self.logger
+            )
             
             self.logger.info("Email sent successfully")
             return True
@@ -182,6 +257,15 @@ class EmailNotifier:
             self.logger.error(f"Failed to send email: {str(e)}")
             return False
     
+    def _send_sync(self, msg: MIMEMultipart):
+        """Synchronous email sending. Raises on failure."""
+        with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+            if self.use_tls:
+                server.starttls()
+            
+            server.login(self.username, self.password)
+            server.send_message(msg)
+    
     async def send_success_notification(
         self,
         to_addresses: List[str],
@@ -275,43 +359,144 @@ class EmailNotifier:
 class WebhookNotifier:
     """Webhook notification handler."""
     
-    def __init__(self, webhook_url: str, timeout: int = 10):
-        """Initialize webhook notifier."""
+    def __init__(
+        self,
+        webhook_url: str,
+        timeout: int = 10,
+        batch_enabled: bool = False,
+        max_batch: int = 50,
+        max_wait_ms: int = 500
+    ):
+        """
+        Initialize webhook notifier.
+        
+        Args:
+            webhook_url: URL to POST payloads to
+            timeout: Request timeout in seconds
+            batch_enabled: Coalesce events into {"batch": [...]} posts
+            max_batch: Maximum number of events per batch
+            max_wait_ms: Maximum time to wait for more events before flushing
+        """
         self.webhook_url = webhook_url
         self.timeout = timeout
+        self.batch_enabled = batch_enabled
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
         self.logger = get_logger(__name__)
+        
+        # Reused across sends so connections are kept alive. Both the client
+        # and the batch flusher are bound to the loop that created them.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+    
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Ensure HTTP client is initialized for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Flush pending batched events and close HTTP client."""
+        if self._flusher_task and self._flusher_task.get_loop() is asyncio.get_running_loop():
+            await self._queue.join()
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+        self._flusher_task = None
+        self._queue = None
+        
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
     
     @log_async_function_call()
     async def send_webhook(self, payload: Dict[str, Any]) -> bool:
         """
         Send webhook notification.
         
+        When batching is enabled the payload is queued and coalesced with
+        other events arriving within max_wait_ms; the call resolves once the
+        batch containing it has been posted.
+        
         Args:
             payload: JSON payload to send
             
         Returns:
             True if successful, False otherwise
         """
+        # Add timestamp
+        payload['timestamp'] = datetime.utcnow().isoformat() + 'Z'
+        
+        if self.batch_enabled:
+            return await self._enqueue(payload)
+        
+        return await self._post_payload(payload)
+    
+    async def _post_payload(self, payload: Dict[str, Any]) -> bool:
+        """POST a payload to the webhook URL."""
         try:
-            # Add timestamp
-            payload['timestamp'] = datetime.utcnow().isoformat() + 'Z'
+            body = orjson.dumps(payload, default=str)
+            client = await self._ensure_client()
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.webhook_url, json=payload)
+            async def _post():
+                response = await client.post(self.webhook_url, content=body, headers=_JSON_HEADERS)
                 response.raise_for_status()
-                
-                self.logger.info(f"Webhook sent successfully to {self.webhook_url}")
-                return True
+                return response
+            
+            await _retry(_post, logger=self.logger)
+            
+            self.logger.info(f"Webhook sent successfully to {self.webhook_url}")
+            return True
                 
         except Exception as e:
             self.logger.error(f"Failed to send webhook: {str(e)}")
             return False
     
+    async def _enqueue(self, payload: Dict[str, Any]) -> bool:
+        """Queue a payload for the batch flusher and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if self._flusher_task is None or self._flusher_task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._flusher_task = loop.create_task(self._flusher())
+        
+        future = loop.create_future()
+        await self._queue.put((payload, future))
+        return await future
+    
+    async def _flusher(self):
+        """Drain the queue in batches of up to max_batch events."""
+        loop = asyncio.get_running_loop()
+        max_wait = self.max_wait_ms / 1000
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + max_wait
+            
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            success = await self._post_payload({'batch': [payload for payload, _ in batch]})
+            
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(success)
+                self._queue.task_done()
+    
     async def send_success_notification(self, run_id: str, stats: Dict[str, Any]) -> bool:
         """Send success notification."""
         payload = {
-            "event": "processing_completed",
-            "status": "success",
+            **_SUCCESS_PAYLOAD_STATIC,
             "run_id": run_id,
             "stats": stats
         }
@@ -321,8 +506,7 @@ class WebhookNotifier:
     async def send_error_notification(self, run_id: str, error: str, context: Dict[str, Any]) -> bool:
         """Send error notification."""
         payload = {
-            "event": "processing_failed",
-            "status": "error",
+            **_ERROR_PAYLOAD_STATIC,
             "run_id": run_id,
             "error": error,
             "context": context
@@ -343,6 +527,10 @@ class NotificationManager:
         self.email_notifier = None
         self.webhook_notifier = None
         
+        # Dispatch lists of (channel, handler) built once from config
+        self._success_handlers: List[Tuple[str, Callable[..., Awaitable[bool]]]] = []
+        self._error_handlers: List[Tuple[str, Callable[..., Awaitable[bool]]]] = []
+        
         if config:
             self._setup_notifiers()
     
@@ -369,48 +557,79 @@ class NotificationManager:
         if self.config.webhook and self.config.webhook.enabled:
             self.webhook_notifier = WebhookNotifier(
                 webhook_url=self.config.webhook.url,
-                timeout=self.config.webhook.timeout
+                timeout=self.config.webhook.timeout,
+                batch_enabled=self.config.webhook.batch_enabled,
+                max_batch=self.config.webhook.max_batch,
+                max_wait_ms=self.config.webhook.max_wait_ms
             )
+        
+        self._build_dispatch_lists()
     
-    async def send_success_notifications(self, run_id: str, stats: Dict[str, Any]) -> Dict[str, bool]:
-        """Send success notifications via all enabled channels."""
-        results = {}
+    def _build_dispatch_lists(self):
+        """Precompute the enabled success/error handlers for each channel."""
+        self._success_handlers = []
+        self._error_handlers = []
         
         # Telegram
-        if self.telegram_notifier and self.config.telegram.on_success:
-            results['telegram'] = await self.telegram_notifier.send_success_notification(run_id, stats)
+        if self.telegram_notifier:
+            if self.config.telegram.on_success:
+                self._success_handlers.append(
+                    ('telegram', self.telegram_notifier.send_success_notification)
+                )
+            if self.config.telegram.on_error:
+                self._error_handlers.append(
+                    ('telegram', self.telegram_notifier.send_error_notification)
+                )
         
-        # Email
-        if self.email_notifier and self.config.email.on_success:
-            results['email'] = await self.email_notifier.send_success_notification(
-                self.config.email.to_addresses, run_id, stats
-            )
+        # Email (recipients are bound up front)
+        if self.email_notifier:
+            to_addresses = self.config.email.to_addresses
+            if self.config.email.on_success:
+                self._success_handlers.append(
+                    ('email', partial(self.email_notifier.send_success_notification, to_addresses))
+                )
+            if self.config.email.on_error:
+                self._error_handlers.append(
+                    ('email', partial(self.email_notifier.send_error_notification, to_addresses))
+                )
         
         # Webhook
-        if self.webhook_notifier and self.config.webhook.on_success:
-            results['webhook'] = await self.webhook_notifier.send_success_notification(run_id, stats)
+        if self.webhook_notifier:
+            if self.config.webhook.on_success:
+                self._success_handlers.append(
+                    ('webhook', self.webhook_notifier.send_success_notification)
+                )
+            if self.config.webhook.on_error:
+                self._error_handlers.append(
+                    ('webhook', self.webhook_notifier.send_error_notification)
+                )
+    
+    async def send_success_notifications(self, run_id: str, stats: Dict[str, Any]) -> Dict[str, bool]:
+        """Send success notifications via all enabled channels."""
+        if not self._success_handlers:
+            return {}
         
-        return results
+        results = await asyncio.gather(
+            *(handler(run_id, stats) for _, handler in self._success_handlers)
+        )
+        return {channel: result for (channel, _), result in zip(self._success_handlers, results)}
     
     async def send_error_notifications(self, run_id: str, error: str, context: Dict[str, Any]) -> Dict[str, bool]:
         """Send error notifications via all enabled channels."""
-        results = {}
-        
-        # Telegram
-        if self.telegram_notifier and self.config.telegram.on_error:
-            results['telegram'] = await self.telegram_notifier.send_error_notification(run_id, error, context)
+        if not self._error_handlers:
+            return {}
         
-        # Email
-        if self.email_notifier and self.config.email.on_error:
-            results['email'] = await self.email_notifier.send_error_notification(
-                self.config.email.to_addresses, run_id, error, context
-            )
-        
-        # Webhook
-        if self.webhook_notifier and self.config.webhook.on_error:
-            results['webhook'] = await self.webhook_notifier.send_error_notification(run_id, error, context)
+        results = await asyncio.gather(
+            *(handler(run_id, error, context) for _, handler in self._error_handlers)
+        )
+        return {channel: result for (channel, _), result in zip(self._error_handlers, results)}
+    
+    async def aclose(self):
+        """Release notification resources, waiting for in-flight emails."""
+        if self.webhook_notifier:
+            await self.webhook_notifier.aclose()
         
-        return results
+        await asyncio.to_thread(_shutdown_smtp_executor)
     
     def get_enabled_channels(self) -> List[str]:
         """Get list of enabled notification channels."""
@@ -5,6 +5,8 @@ Uses APScheduler to manage scheduled data processing jobs.
 """
 
 import asyncio
+import threading
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -16,6 +18,30 @@ from .logger import get_logger, log_function_call
 from .config import SchedulerConfig, JobConfig, IntervalConfig
 
 
+@lru_cache(maxsize=256)
+def _make_cron(
+    hour: Optional[str],
+    minute: Optional[str],
+    day: Optional[str],
+    month: Optional[str],
+    day_of_week: Optional[str]
+) -> CronTrigger:
+    """
+    Build a cron trigger, reusing the instance for identical fields.
+    
+    Cron triggers hold no per-job state, so config reloads can share the
+    already-validated instance. Interval triggers are not cached because
+    they anchor their start date at construction time.
+    """
+    return CronTrigger(
+        hour=hour,
+        minute=minute,
+        day=day,
+        month=month,
+        day_of_week=day_of_week
+    )
+
+
 class JobRunner:
     """Job runner wrapper for async job execution."""
     
@@ -66,12 +92,13 @@ class SchedulerManager:
         self.job_functions: Dict[str, Callable] = {}
         self.active_jobs: Dict[str, Dict[str, Any]] = {}
         
-        # Statistics
+        # Statistics (updated from APScheduler worker threads)
         self.job_stats = {
             'total_runs': 0,
             'successful_runs': 0,
             'failed_runs': 0
         }
+        self._stats_lock = threading.Lock()
     
     def register_job_function(self, name: str, func: Callable):
         """
@@ -155,12 +182,12 @@ class SchedulerManager:
         try:
             if job_config.trigger == "cron":
                 if job_config.cron:
-                    return CronTrigger(
-                        hour=job_config.cron.hour,
-                        minute=job_config.cron.minute,
-                        day=job_config.cron.day,
-                        month=job_config.cron.month,
-                        day_of_week=job_config.cron.day_of_week
+                    return _make_cron(
+                        job_config.cron.hour,
+                        job_config.cron.minute,
+                        job_config.cron.day,
+                        job_config.cron.month,
+                        job_config.cron.day_of_week
                     )
             elif job_config.trigger == "interval":
                 if job_config.interval:
@@ -243,52 +270,52 @@ class SchedulerManager:
         
         return False
     
+    def _build_status(self, job_id: str, job_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the status dict for a tracked job."""
+        scheduler_job = job_info['job']
+        
+        return {
+            'id': job_id,
+            'name': scheduler_job.name,
+            'target': job_info['config'].target,
+            'trigger': str(scheduler_job.trigger),
+            'next_run_time': scheduler_job.next_run_time.isoformat() if scheduler_job.next_run_time else None,
+            'created_at': job_info['created_at'].isoformat(),
+            'last_run': job_info.get('last_run'),
+            'status': 'active' if scheduler_job else 'removed'
+        }
+    
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific job."""
-        if job_id in self.active_jobs:
-            job_info = self.active_jobs[job_id]
-            scheduler_job = job_info['job']
-            
-            return {
-                'id': job_id,
-                'name': scheduler_job.name,
-                'target': job_info['config'].target,
-                'trigger': str(scheduler_job.trigger),
-                'next_run_time': scheduler_job.next_run_time.isoformat() if scheduler_job.next_run_time else None,
-                'created_at': job_info['created_at'].isoformat(),
-                'last_run': job_info.get('last_run'),
-                'status': 'active' if scheduler_job else 'removed'
-            }
+        job_info = self.active_jobs.get(job_id)
+        if job_info is None:
+            return None
         
-        return None
+        return self._build_status(job_id, job_info)
     
     def get_all_jobs(self) -> List[Dict[str, Any]]:
         """Get status of all jobs."""
-        jobs = []
-        for job_id in self.active_jobs:
-            status = self.get_job_status(job_id)
-            if status:
-                jobs.append(status)
-        
-        return jobs
+        return [self._build_status(job_id, job_info) for job_id, job_info in self.active_jobs.items()]
     
     def get_scheduler_status(self) -> Dict[str, Any]:
         """Get scheduler status."""
+        with self._stats_lock:
+            job_stats = dict(self.job_stats)
+        
         return {
             'running': self.scheduler.running,
             'timezone': str(self.scheduler.timezone),
             'active_jobs': len(self.active_jobs),
             'total_jobs': len(self.scheduler.get_jobs()),
-            'job_stats': self.job_stats.copy()
+            'job_stats': job_stats
         }
     
     def update_job_stats(self, success: bool):
         """Update job execution statistics."""
-        self.job_stats['total_runs'] += 1
-        if success:
-            self.job_stats['successful_runs'] += 1
-        else:
-            self.job_stats['failed_runs'] += 1
+        outcome_key = 'successful_runs' if success else 'failed_runs'
+        with self._stats_lock:
+            self.job_stats['total_runs'] += 1
+            self.job_stats[outcome_key] += 1
     
     def get_upcoming_runs(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get upcoming job runs within specified hours."""
@@ -1,21 +1,37 @@
 """
 Web scraper for HEX Data Processor.
 
-Supports static scraping with BeautifulSoup and optional JS rendering.
+Supports static scraping with BeautifulSoup (or selectolax / compiled lxml
+XPath when installed) and optional JS rendering.
 """
 
 import asyncio
 import time
-from typing import Dict, List, Any, Optional, Set
-from urllib.parse import urljoin, urlparse
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 from datetime import datetime
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from lxml import etree
 import httpx
+import soupsieve
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional fast parser
+    LexborHTMLParser = None
+
+try:
+    from cssselect import GenericTranslator
+except ImportError:  # Optional CSS-to-XPath compiler
+    GenericTranslator = None
 
 from .http_client import HTTPClient
-from .logger import get_logger, log_async_function_call
+from .logger import get_logger, log_async_function_call, log_function_call
 from .config import TargetConfig
+from .utils import BloomFilter
 
 
 class JSError(Exception):
@@ -23,6 +39,130 @@ class JSError(Exception):
     pass
 
 
+# Extractor kinds for compiled selector plans
+_KIND_TEXT = 0
+_KIND_HREF = 1
+_KIND_HTML = 2
+
+# URLs per crawl tracked exactly before the Bloom filter is consulted
+RECENT_URLS_SIZE = 10000
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for deduplication (drop fragment, lowercase scheme and host)."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+
+
+class _SeenURLs:
+    """
+    URLs already scheduled in a crawl, in bounded memory.
+    
+    The most recent URLs are kept in an exact set, so the first
+    recent_size URLs of a crawl (the seeds and the pages near them) never
+    hit a Bloom false positive; older URLs are only in the Bloom filter.
+    """
+    
+    def __init__(self, bloom_capacity: int, recent_size: int = RECENT_URLS_SIZE):
+        self._bloom = BloomFilter(capacity=bloom_capacity, error_rate=1e-6)
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self._recent_size = recent_size
+        self._evicted = False
+    
+    def add(self, url: str) -> None:
+        """Mark a URL as scheduled."""
+        self._bloom.add(url)
+        self._recent[url] = None
+        self._recent.move_to_end(url)
+        if len(self._recent) > self._recent_size:
+            self._recent.popitem(last=False)
+            self._evicted = True
+    
+    def __contains__(self, url: str) -> bool:
+        if url in self._recent:
+            return True
+        # Until a URL has been evicted the exact set holds every URL
+        return self._evicted and url in self._bloom
+    
+    def __len__(self) -> int:
+        return len(self._bloom)
+
+
+@lru_cache(maxsize=512)
+def _compile_css(css_selector: str) -> "soupsieve.SoupSieve":
+    """Compile a CSS selector once for reuse on BeautifulSoup nodes."""
+    # Tag.select() re-resolves the selector through soupsieve on every call
+    return soupsieve.compile(css_selector)
+
+
+@lru_cache(maxsize=512)
+def _compile_xpath(css_selector: str) -> "etree.XPath":
+    """Compile a CSS selector to a reusable lxml XPath expression."""
+    # descendant:: (not descendant-or-self::) matches BeautifulSoup's select()
+    return etree.XPath(GenericTranslator().css_to_xpath(css_selector, prefix='descendant::'))
+
+
+@lru_cache(maxsize=1024)
+def _urljoin(base_url: str, url: str) -> str:
+    """Cached urljoin; hrefs on a page mostly share the same base."""
+    return urljoin(base_url, url)
+
+
+def _absolute_url(base_url: str, url: str) -> str:
+    """Resolve url against base_url, skipping the join for absolute URLs."""
+    if url.startswith(('http://', 'https://')):
+        return url
+    return _urljoin(base_url, url)
+
+
+def _select_all(node, css_selector: str) -> list:
+    """Select all matching nodes from a BeautifulSoup, lxml or Lexbor node."""
+    if isinstance(node, Tag):
+        return _compile_css(css_selector).select(node)
+    if isinstance(node, etree._Element):
+        return _compile_xpath(css_selector)(node)
+    return node.css(css_selector)
+
+
+def _select_first(node, css_selector: str):
+    """Select the first matching node from a BeautifulSoup, lxml or Lexbor node."""
+    if isinstance(node, Tag):
+        return _compile_css(css_selector).select_one(node)
+    if isinstance(node, etree._Element):
+        matches = _compile_xpath(css_selector)(node)
+        return matches[0] if matches else None
+    return node.css_first(css_selector)
+
+
+def _node_text(node) -> str:
+    """Get stripped text content of a node."""
+    if isinstance(node, Tag):
+        return node.get_text(strip=True)
+    if isinstance(node, etree._Element):
+        return ''.join(text.strip() for text in node.itertext())
+    return node.text(strip=True)
+
+
+def _node_attr(node, name: str) -> Optional[str]:
+    """Get an attribute value of a node."""
+    if isinstance(node, (Tag, etree._Element)):
+        return node.get(name)
+    return node.attributes.get(name)
+
+
+def _extract(element, css_selector: str, kind: int, source_url: str) -> Optional[str]:
+    """Extract one field value from an item element according to its kind."""
+    node = _select_first(element, css_selector)
+    if node is None:
+        return None
+    if kind == _KIND_HREF:
+        attr_value = _node_attr(node, 'href')
+        # Convert relative URLs to absolute
+        return _absolute_url(source_url, attr_value) if attr_value else None
+    # Text and full-content selectors both yield stripped text
+    return _node_text(node)
+
+
 class Scraper:
     """Async web scraper with static and JS rendering support."""
     
@@ -31,6 +171,10 @@ class Scraper:
         self.http_client = http_client
         self.logger = get_logger(__name__)
         self._js_renderer_available = self._check_js_renderer()
+        # id(target_config) -> (selectors snapshot, compiled plan)
+        self._selector_plans: Dict[int, Tuple[Tuple[Tuple[str, str], ...], List[Tuple[str, str, int]]]] = {}
+        # (scheme, netloc) -> robots.txt check result
+        self._robots_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
     
     def _check_js_renderer(self) -> bool:
         """Check if JavaScript renderer is available."""
@@ -86,48 +230,87 @@ class Scraper:
         target_config: TargetConfig,
         run_id: str
     ) -> List[Dict[str, Any]]:
-        """Scrape using static HTML parsing."""
-        base_url = str(target_config.base_url)
-        items = []
-        processed_urls: Set[str] = set()
+        """
+        Scrape using static HTML parsing.
         
-        # Get initial URLs
-        urls_to_process = list(target_config.start_urls)
+        Seed URLs are fetched concurrently (bounded by max_concurrency) and
+        each page is parsed as soon as its response arrives. Pagination
+        next links are scheduled the moment they are discovered.
+        """
+        base_url = str(target_config.base_url)
+        # Single source of truth for every URL already scheduled; large
+        # crawls can trade exactness for memory with a Bloom filter
+        seen = (
+            _SeenURLs(target_config.bloom_capacity)
+            if target_config.bloom_capacity else set()
+        )
+        semaphore = asyncio.Semaphore(target_config.max_concurrency)
+        paginate = bool(target_config.pagination and target_config.pagination.enabled)
+        max_pages = target_config.pagination.max_pages if paginate else None
+        # (seed index, page depth) -> items, so output order stays deterministic
+        page_results: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
         
-        for url in urls_to_process:
-            if url in processed_urls:
-                continue
-                
-            processed_urls.add(str(url))
-            
+        async def fetch_page(url: str, key: Tuple[int, int]):
             try:
-                response = await self.http_client.fetch(str(url))
-                soup = BeautifulSoup(response['text'], 'html.parser')
-                
-                # Extract items from current page
-                page_items = await self._extract_items(soup, target_config, str(url), run_id)
-                items.extend(page_items)
-                
-                self.logger.info(
-                    f"Extracted {len(page_items)} items from {url}",
-                    extra={"run_id": run_id, "url": str(url), "items_count": len(page_items)}
-                )
-                
-                # Handle pagination if enabled
-                if target_config.pagination and target_config.pagination.enabled:
-                    next_url = self._get_next_url(soup, target_config, base_url)
-                    if next_url and next_url not in processed_urls:
-                        urls_to_process.append(next_url)
-                        # Limit pagination to avoid infinite loops
-                        if len(urls_to_process) > target_config.pagination.max_pages:
-                            break
-                
+                async with semaphore:
+                    response = await self.http_client.fetch(url)
+                return url, key, response, None
             except Exception as e:
-                self.logger.error(
-                    f"Failed to scrape {url}: {str(e)}",
-                    extra={"run_id": run_id, "url": str(url), "error": str(e)}
-                )
-                continue
+                return url, key, None, e
+        
+        pending = set()
+        
+        def schedule(url: str, key: Tuple[int, int]) -> None:
+            seen.add(url)
+            pending.add(asyncio.ensure_future(fetch_page(url, key)))
+        
+        # Fan out over all seed URLs, deduplicated in order
+        urls_to_process = list(dict.fromkeys(_normalize_url(str(u)) for u in target_config.start_urls))
+        for seed_index, url in enumerate(urls_to_process):
+            schedule(url, (seed_index, 0))
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    url, key, response, error = task.result()
+                    try:
+                        if error is not None:
+                            raise error
+                        
+                        soup = self._parse_html(response['text'], target_config)
+                        
+                        # Extract items from current page
+                        page_items = self._extract_items(soup, target_config, url, run_id)
+                        page_results[key] = page_items
+                        
+                        self.logger.info(
+                            f"Extracted {len(page_items)} items from {url}",
+                            extra={"run_id": run_id, "url": url, "items_count": len(page_items)}
+                        )
+                        
+                        # Handle pagination if enabled
+                        if paginate:
+                            next_url = self._get_next_url(soup, target_config, base_url)
+                            if next_url:
+                                next_url = _normalize_url(next_url)
+                            # Limit pagination to avoid infinite loops
+                            if (next_url and next_url not in seen
+                                    and len(seen) < max_pages):
+                                schedule(next_url, (key[0], key[1] + 1))
+                        
+                    except Exception as e:
+                        self.logger.error(
+                            f"Failed to scrape {url}: {str(e)}",
+                            extra={"run_id": run_id, "url": url, "error": str(e)}
+                        )
+                        continue
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        items = [item for key in sorted(page_results) for item in page_results[key]]
         
         self.logger.info(
             f"Static scraping completed. Total items: {len(items)}",
@@ -136,6 +319,34 @@ class Scraper:
         
         return items
     
+    def _parse_html(self, text: str, target_config: TargetConfig):
+        """Parse page HTML with the parser configured for the target.
+        
+        An already parsed BeautifulSoup document is returned unchanged.
+        """
+        if isinstance(text, BeautifulSoup):
+            return text
+        
+        if target_config.parser == 'selectolax':
+            if LexborHTMLParser is not None:
+                return LexborHTMLParser(text)
+            self.logger.warning(
+                "selectolax parser requested but not installed, falling back to lxml",
+                extra={"target": target_config.name}
+            )
+            return BeautifulSoup(text, 'lxml')
+        
+        if target_config.parser == 'lxml-xpath':
+            if GenericTranslator is not None:
+                return etree.HTML(text)
+            self.logger.warning(
+                "lxml-xpath parser requested but cssselect not installed, falling back to lxml",
+                extra={"target": target_config.name}
+            )
+            return BeautifulSoup(text, 'lxml')
+        
+        return BeautifulSoup(text, target_config.parser)
+    
     @log_async_function_call()
     async def _scrape_with_js(
         self,
@@ -158,15 +369,15 @@ class Scraper:
         # Fallback to static scraping for demo
         return await self._scrape_static(target_config, run_id)
     
-    @log_async_function_call()
-    async def _extract_items(
+    @log_function_call()
+    def _extract_items(
         self,
-        soup: BeautifulSoup,
+        soup,
         target_config: TargetConfig,
         source_url: str,
         run_id: str
     ) -> List[Dict[str, Any]]:
-        """Extract items from BeautifulSoup object."""
+        """Extract items from a parsed document (BeautifulSoup or Lexbor)."""
         items = []
         
         # Find all item containers
@@ -178,69 +389,94 @@ class Scraper:
             )
             return items
         
-        item_elements = soup.select(item_selector)
+        item_elements = _select_all(soup, item_selector)
+        
+        # Metadata is shared by every item on the page, so build it once
+        metadata = self._page_metadata(target_config, source_url, run_id)
         
         for element in item_elements:
-            item = await self._extract_item_data(element, target_config, source_url, run_id)
+            item = self._extract_item_data(
+                element, target_config, source_url, run_id, metadata=metadata
+            )
             if item:
                 items.append(item)
         
         return items
     
-    @log_async_function_call()
-    async def _extract_item_data(
+    def _page_metadata(
         self,
-        element,
         target_config: TargetConfig,
         source_url: str,
         run_id: str
+    ) -> Dict[str, Any]:
+        """Build the metadata fields attached to every item from one page."""
+        return {
+            'source_url': source_url,
+            'fetch_time': datetime.utcnow().isoformat() + 'Z',
+            'run_id': run_id,
+            'target_name': target_config.name
+        }
+    
+    def _compile_selectors(self, target_config: TargetConfig) -> List[Tuple[str, str, int]]:
+        """
+        Pre-parse field selectors into an extraction plan.
+        
+        Args:
+            target_config: Target configuration
+            
+        Returns:
+            List of (field, css_selector, kind) tuples, cached per target
+        """
+        snapshot = tuple(target_config.selectors.items())
+        cached = self._selector_plans.get(id(target_config))
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+        
+        plan = []
+        for field, selector in snapshot:
+            if field == 'quote':  # Skip the container selector
+                continue
+            
+            if selector.endswith('::text'):
+                plan.append((field, selector.replace('::text', ''), _KIND_TEXT))
+            elif selector.endswith('::attr(href)'):
+                plan.append((field, selector.replace('::attr(href)', ''), _KIND_HREF))
+            else:
+                plan.append((field, selector, _KIND_HTML))
+        
+        self._selector_plans[id(target_config)] = (snapshot, plan)
+        return plan
+    
+    def _extract_item_data(
+        self,
+        element,
+        target_config: TargetConfig,
+        source_url: str,
+        run_id: str,
+        metadata: Optional[Dict[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
-        """Extract data from a single item element."""
-        try:
-            item_data = {}
+        """
+        Extract data from a single item element.
+        
+        Args:
+            element: Item container node
+            target_config: Target configuration
+            source_url: URL the item was scraped from
+            run_id: Unique identifier for this scraping run
+            metadata: Precomputed page metadata (built here if omitted)
             
-            # Extract each field based on selectors
-            for field, selector in target_config.selectors.items():
-                if field == 'quote':  # Skip the container selector
-                    continue
-                
-                if selector.endswith('::text'):
-                    # Extract text content
-                    css_selector = selector.replace('::text', '')
-                    elements = element.select(css_selector)
-                    if elements:
-                        text_content = elements[0].get_text(strip=True)
-                        item_data[field] = text_content
-                    else:
-                        item_data[field] = None
-                elif selector.endswith('::attr(href)'):
-                    # Extract attribute value
-                    css_selector = selector.replace('::attr(href)', '')
-                    elements = element.select(css_selector)
-                    if elements:
-                        attr_value = elements[0].get('href', '')
-                        # Convert relative URLs to absolute
-                        if attr_value:
-                            item_data[field] = urljoin(source_url, attr_value)
-                        else:
-                            item_data[field] = None
-                    else:
-                        item_data[field] = None
-                else:
-                    # Extract full HTML content
-                    elements = element.select(selector)
-                    if elements:
-                        item_data[field] = elements[0].get_text(strip=True)
-                    else:
-                        item_data[field] = None
+        Returns:
+            Item data, or None if extraction failed
+        """
+        try:
+            # Extract each field based on the compiled selector plan
+            item_data = {
+                field: _extract(element, css_selector, kind, source_url)
+                for field, css_selector, kind in self._compile_selectors(target_config)
+            }
             
             # Add metadata
-            item_data.update({
-                'source_url': source_url,
-                'fetch_time': datetime.utcnow().isoformat() + 'Z',
-                'run_id': run_id,
-                'target_name': target_config.name
-            })
+            item_data |= metadata or self._page_metadata(target_config, source_url, run_id)
             
             return item_data
             
@@ -253,7 +489,7 @@ class Scraper:
     
     def _get_next_url(
         self,
-        soup: BeautifulSoup,
+        soup,
         target_config: TargetConfig,
         base_url: str
     ) -> Optional[str]:
@@ -262,38 +498,51 @@ class Scraper:
             return None
         
         try:
-            next_element = soup.select_one(target_config.pagination.next_selector)
-            if next_element:
-                next_url = next_element.get('href') or next_element.get_text(strip=True)
+            next_element = _select_first(soup, target_config.pagination.next_selector)
+            if next_element is not None:
+                next_url = _node_attr(next_element, 'href') or _node_text(next_element)
                 if next_url:
-                    return urljoin(base_url, next_url)
+                    return _absolute_url(base_url, next_url)
         except Exception as e:
             self.logger.error(f"Error getting next URL: {str(e)}")
         
         return None
     
     async def check_robots_txt(self, url: str) -> Dict[str, Any]:
-        """Check robots.txt for scraping permissions."""
+        """
+        Check robots.txt for scraping permissions.
+        
+        Results (including failures) are cached per scheme and host, so
+        repeated checks against the same site do not refetch.
+        """
+        parsed_url = urlparse(url)
+        host_key = (parsed_url.scheme, parsed_url.netloc)
+        cached = self._robots_cache.get(host_key)
+        if cached is not None:
+            return dict(cached)
+        
+        robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
+        
         try:
-            parsed_url = urlparse(url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
-            
             response = await self.http_client.fetch(robots_url)
             content = response['text']
             
-            return {
+            result = {
                 "url": robots_url,
                 "content": content,
                 "accessible": True
             }
         except Exception as e:
             self.logger.warning(f"Could not fetch robots.txt: {str(e)}")
-            return {
-                "url": robots_url if 'robots_url' in locals() else url + "/robots.txt",
+            result = {
+                "url": robots_url,
                 "content": None,
                 "accessible": False,
                 "error": str(e)
             }
+        
+        self._robots_cache[host_key] = result
+        return dict(result)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ Defines the interface that all storage adapters must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional
 from datetime import datetime
 
 
@@ -55,6 +55,22 @@ class StorageAdapter(ABC):
         """
         pass
     
+    async def iter_items(self, limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over stored items one at a time.
+        
+        The default implementation loads everything first; adapters that can
+        stream from their backend override it to keep memory constant.
+        
+        Args:
+            limit: Maximum number of items to yield
+            
+        Yields:
+            Stored items
+        """
+        for item in await self.load(limit):
+            yield item
+    
     @abstractmethod
     async def count(self) -> int:
         """
@@ -5,18 +5,38 @@ Stores data in CSV format with configurable delimiters and encoding.
 """
 
 import csv
+import json
 import os
+import shutil
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
+from functools import partial
 import asyncio
 
 import aiofiles
+import orjson
 
-import json
 from .base import StorageAdapter
 from ..logger import get_logger
 
+# Coalescing writer batch size: starts small and doubles up to the cap
+WRITE_BATCH_START = 100
+WRITE_BATCH_MAX = 10000
+
+# Read size used when counting rows
+COUNT_CHUNK_SIZE = 1 << 20
+
+
+def _parse_cell(value: Any) -> Any:
+    """Decode JSON-looking cells (objects/arrays), leaving other values as is."""
+    if value and value[0] in '{[':
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass  # Keep as string if not valid JSON
+    return value
+
 
 class CSVStorageAdapter(StorageAdapter):
     """Storage adapter for CSV files."""
@@ -64,6 +84,19 @@ class CSVStorageAdapter(StorageAdapter):
         
         self._file_lock = asyncio.Lock()
         self._header_written = False
+        
+        # Column schema cached across saves (read from the file header once)
+        self._fieldnames: Optional[List[str]] = None
+        self._fieldset: Set[str] = set()
+        
+        # Whether the file exists with content; None until first checked
+        self._has_content: Optional[bool] = None
+        
+        # Coalescing writer for save_one (bound to the running event loop)
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._batch_threshold = WRITE_BATCH_START
+        self._write_failed = False
     
     async def save(self, items: List[Dict[str, Any]]) -> bool:
         """Save multiple items to CSV file."""
@@ -73,22 +106,33 @@ class CSVStorageAdapter(StorageAdapter):
         try:
             async with self._file_lock:
                 # Determine if we need to write header
-                file_exists = os.path.exists(self.filename)
-                should_write_header = self.write_header and (not file_exists or self.mode == 'w')
+                has_content = self._file_has_content()
+                should_write_header = self.write_header and (not has_content or self.mode == 'w')
+                
+                if self.mode == 'w' or not has_content:
+                    # File is (re)started, so the schema comes from this batch only
+                    self._set_fieldnames(None)
+                elif self._fieldnames is None and self.write_header:
+                    self._set_fieldnames(await asyncio.to_thread(self._read_header_sync))
                 
-                # Open file for writing
+                # Only union keys not already in the cached schema
+                fieldset = self._fieldset
+                new_fields = {key for item in items for key in item if key not in fieldset}
+                
+                fieldnames = self._fieldnames
+                if fieldnames is None:
+                    fieldnames = sorted(new_fields)
+                elif new_fields:
+                    fieldnames = sorted(fieldset | new_fields)
+                    if self.write_header:
+                        # Schema expanded: rewrite existing rows under the new header
+                        await asyncio.to_thread(self._rewrite_header_sync, fieldnames)
+                
+                # csv module is synchronous, so write straight to the file in a worker thread
                 mode = 'w' if self.mode == 'w' else 'a'
-                async with aiofiles.open(self.filename, mode=mode, newline='', encoding=self.encoding) as f:
-                    # Get all possible fields from all items
-                    all_fields = set()
-                    for item in items:
-                        all_fields.update(item.keys())
-                    
-                    fieldnames = sorted(list(all_fields))
-                    
-                    # Write CSV content synchronously (csv module doesn't support async)
-                    content = await self._prepare_csv_content(items, fieldnames, should_write_header)
-                    await f.write(content)
+                await asyncio.to_thread(self._write_sync, items, fieldnames, should_write_header, mode)
+                self._set_fieldnames(fieldnames)
+                self._has_content = True
                 
                 self.logger.info(f"Saved {len(items)} items to {self.filename}")
                 return True
@@ -97,78 +141,163 @@ class CSVStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to save items to CSV: {str(e)}", exc_info=True)
             return False
     
-    async def _prepare_csv_content(
-        self, 
-        items: List[Dict[str, Any]], 
-        fieldnames: List[str], 
-        write_header: bool
-    ) -> str:
-        """Prepare CSV content as string."""
-        import io
-        
-        output = io.StringIO()
-        writer = csv.DictWriter(
-            output,
-            fieldnames=fieldnames,
-            delimiter=self.delimiter,
-            quoting=self.quoting
-        )
-        
-        if write_header:
+    def _file_has_content(self) -> bool:
+        """Whether the CSV file exists and is non-empty (cached after the first check)."""
+        if self._has_content is None:
+            try:
+                self._has_content = os.path.getsize(self.filename) > 0
+            except OSError:
+                self._has_content = False
+        return self._has_content
+    
+    def _set_fieldnames(self, fieldnames: Optional[List[str]]) -> None:
+        """Update the cached column schema."""
+        self._fieldnames = fieldnames or None
+        self._fieldset = set(fieldnames) if fieldnames else set()
+    
+    def _read_header_sync(self) -> List[str]:
+        """Read the header row of the existing CSV file."""
+        with open(self.filename, 'r', newline='', encoding=self.encoding) as f:
+            return next(csv.reader(f, delimiter=self.delimiter), [])
+    
+    def _rewrite_header_sync(self, fieldnames: List[str]) -> None:
+        """Rewrite the CSV file with an expanded header, padding old rows."""
+        temp_path = f"{self.filename}.tmp"
+        with open(self.filename, 'r', newline='', encoding=self.encoding) as src, \
+                open(temp_path, 'w', newline='', encoding=self.encoding) as dst:
+            reader = csv.DictReader(src, delimiter=self.delimiter)
+            writer = csv.DictWriter(
+                dst,
+                fieldnames=fieldnames,
+                delimiter=self.delimiter,
+                quoting=self.quoting,
+                restval=""
+            )
             writer.writeheader()
+            writer.writerows(reader)
+        os.replace(temp_path, self.filename)
+    
+    def _write_sync(
+        self,
+        items: List[Dict[str, Any]],
+        fieldnames: List[str],
+        write_header: bool,
+        mode: str
+    ) -> None:
+        """Write rows directly to the CSV file (runs in a worker thread)."""
+        with open(self.filename, mode, newline='', encoding=self.encoding) as f:
+            writer = csv.DictWriter(
+                f,
+                fieldnames=fieldnames,
+                delimiter=self.delimiter,
+                quoting=self.quoting
+            )
+            
+            if write_header:
+                writer.writeheader()
+            
+            for item in items:
+                # Convert all values to strings for CSV
+                row = {}
+                for field in fieldnames:
+                    value = item.get(field, "")
+                    if value is None:
+                        row[field] = ""
+                    elif isinstance(value, (list, dict)):
+                        # Convert complex types to JSON strings
+                        try:
+                            row[field] = orjson.dumps(
+                                value, default=str, option=orjson.OPT_NON_STR_KEYS
+                            ).decode('utf-8')
+                        except orjson.JSONEncodeError:
+                            # e.g. integers wider than 64 bits, which orjson rejects
+                            row[field] = json.dumps(value, default=str, ensure_ascii=False)
+                    else:
+                        row[field] = str(value)
+                
+                writer.writerow(row)
+    
+    async def save_one(self, item: Dict[str, Any]) -> bool:
+        """
+        Write a single item.
         
-        for item in items:
-            # Convert all values to strings for CSV
-            row = {}
-            for field in fieldnames:
-                value = item.get(field, "")
-                if value is None:
-                    row[field] = ""
-                elif isinstance(value, (list, dict)):
-                    # Convert complex types to JSON strings
-                    import json
-                    row[field] = json.dumps(value, ensure_ascii=False)
-                else:
-                    row[field] = str(value)
+        Items from concurrent callers are coalesced by a background writer
+        into batched saves; returns the result of the batch holding the item.
+        """
+        loop = asyncio.get_running_loop()
+        if self._writer_task is None or self._writer_task.get_loop() is not loop:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = loop.create_task(self._writer())
+        
+        future = loop.create_future()
+        self._write_queue.put_nowait((item, future))
+        return await future
+    
+    async def _writer(self):
+        """Drain queued items into batched saves, growing the batch size under load."""
+        while True:
+            batch = [await self._write_queue.get()]
+            while len(batch) < self._batch_threshold:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
             
-            writer.writerow(row)
+            if len(batch) >= self._batch_threshold:
+                self._batch_threshold = min(self._batch_threshold * 2, WRITE_BATCH_MAX)
+            
+            success = False
+            try:
+                success = await self.save([item for item, _ in batch])
+            finally:
+                if not success:
+                    self._write_failed = True
+                    self.logger.error(f"Failed to write {len(batch)} queued items to {self.filename}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(success)
+                    self._write_queue.task_done()
+    
+    async def flush(self) -> bool:
+        """
+        Wait until all items queued by save_one have been written.
+        
+        Returns:
+            False if any queued batch failed to save since the last flush
+        """
+        await self._drain()
         
-        return output.getvalue()
+        success = not self._write_failed
+        self._write_failed = False
+        return success
     
-    async def save_one(self, item: Dict[str, Any]) -> bool:
-        """Save a single item to CSV file."""
-        return await self.save([item])
+    async def _drain(self):
+        """Wait for the queue to empty, leaving any write failure for flush() to report."""
+        if self._writer_task and self._writer_task.get_loop() is asyncio.get_running_loop():
+            await self._write_queue.join()
+    
+    async def close(self):
+        """Flush queued items and stop the background writer."""
+        await self._drain()
+        if self._writer_task and self._writer_task.get_loop() is asyncio.get_running_loop():
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+        self._write_queue = None
     
     async def load(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Load items from CSV file."""
-        if not os.path.exists(self.filename):
+        await self._drain()
+        
+        if not self._file_has_content():
             return []
         
         try:
-            items = []
-            
             async with self._file_lock:
-                async with aiofiles.open(self.filename, 'r', encoding=self.encoding) as f:
-                    content = await f.read()
-                    
-                    # Parse CSV content synchronously
-                    import io
-                    input_io = io.StringIO(content)
-                    reader = csv.DictReader(input_io, delimiter=self.delimiter)
-                    
-                    for row in reader:
-                        # Try to parse JSON fields
-                        for key, value in row.items():
-                            if value and value.startswith(('{', '[')):
-                                try:
-                                    row[key] = json.loads(value)
-                                except:
-                                    pass  # Keep as string if not valid JSON
-                        
-                        items.append(row)
-                        
-                        if limit and len(items) >= limit:
-                            break
+                items = await asyncio.to_thread(self._load_sync, limit)
             
             self.logger.info(f"Loaded {len(items)} items from {self.filename}")
             return items
@@ -177,41 +306,69 @@ class CSVStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to load items from CSV: {str(e)}", exc_info=True)
             return []
     
+    def _load_sync(self, limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Stream rows from the CSV file, stopping once limit is reached."""
+        items = []
+        
+        with open(self.filename, 'r', newline='', encoding=self.encoding) as f:
+            reader = csv.DictReader(f, delimiter=self.delimiter)
+            
+            for row in reader:
+                items.append({key: _parse_cell(value) for key, value in row.items()})
+                
+                if limit and len(items) >= limit:
+                    break
+        
+        return items
+    
     async def count(self) -> int:
         """Count items in CSV file."""
-        if not os.path.exists(self.filename):
+        await self._drain()
+        
+        if not self._file_has_content():
             return 0
         
         try:
-            count = 0
             async with self._file_lock:
-                async with aiofiles.open(self.filename, 'r', encoding=self.encoding) as f:
-                    # Skip header row
-                    first_line = await f.readline()
-                    if not first_line:
-                        return 0
-                    
-                    # Count remaining lines
-                    async for line in f:
-                        if line.strip():  # Skip empty lines
-                            count += 1
-            
-            return count
+                return await asyncio.to_thread(self._count_sync)
             
         except Exception as e:
             self.logger.error(f"Failed to count CSV items: {str(e)}")
             return 0
     
+    def _count_sync(self) -> int:
+        """Count data rows by counting newline bytes in large binary chunks."""
+        lines = 0
+        last_chunk = b''
+        
+        with open(self.filename, 'rb') as f:
+            for chunk in iter(partial(f.read, COUNT_CHUNK_SIZE), b''):
+                lines += chunk.count(b'\n')
+                last_chunk = chunk
+        
+        if not last_chunk:
+            return 0
+        if not last_chunk.endswith(b'\n'):
+            lines += 1  # Last line has no trailing newline
+        
+        # Skip header row
+        return max(0, lines - 1)
+    
     async def clear(self) -> bool:
         """Clear all items from CSV file."""
+        await self._drain()
+        
         try:
             async with self._file_lock:
-                if os.path.exists(self.filename):
+                if self._file_has_content():
                     async with aiofiles.open(self.filename, 'w', encoding=self.encoding) as f:
                         # Write empty file or just header
                         if self.write_header:
                             await f.write("")  # Will be handled by next save operation
                 
+                self._set_fieldnames(None)
+                self._has_content = False
+                
             self.logger.info(f"Cleared CSV file: {self.filename}")
             return True
             
@@ -219,22 +376,56 @@ class CSVStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to clear CSV file: {str(e)}")
             return False
     
+    async def backup(self, backup_path: str) -> bool:
+        """
+        Create a backup of the CSV file.
+        
+        CSV-to-CSV backups copy the file at the OS level; other formats
+        fall back to the load-and-save conversion in the base class.
+        
+        Args:
+            backup_path: Path for backup file
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not backup_path.endswith('.csv'):
+            return await super().backup(backup_path)
+        
+        await self._drain()
+        
+        if not self._file_has_content():
+            return True
+        
+        try:
+            Path(backup_path).parent.mkdir(parents=True, exist_ok=True)
+            async with self._file_lock:
+                await asyncio.to_thread(shutil.copyfile, self.filename, backup_path)
+            
+            self.logger.info(f"Backed up {self.filename} to {backup_path}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to back up CSV file: {str(e)}")
+            return False
+    
     def get_storage_info(self) -> Dict[str, Any]:
         """Get information about the CSV storage."""
         info = super().get_storage_info()
         
-        # Add file-specific information
-        if os.path.exists(self.filename):
+        # Add file-specific information (single stat call)
+        try:
             stat = os.stat(self.filename)
+        except OSError:
             info.update({
-                "file_size": stat.st_size,
-                "file_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "file_exists": True
+                "file_size": 0,
+                "file_exists": False
             })
         else:
             info.update({
-                "file_size": 0,
-                "file_exists": False
+                "file_size": stat.st_size,
+                "file_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "file_exists": True
             })
         
         return info
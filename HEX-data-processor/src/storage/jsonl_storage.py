@@ -4,18 +4,58 @@ JSONL storage adapter for HEX Data Processor.
 Stores data in JSON Lines format (one JSON object per line).
 """
 
+import codecs
 import json
+import math
+import mmap
 import os
+import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, BinaryIO, Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
 import asyncio
 
 import aiofiles
+import orjson
+
+try:
+    import simdjson
+except ImportError:  # Optional lazy parser for search
+    simdjson = None
 
 from .base import StorageAdapter
 from ..logger import get_logger
 
+# Chunk size for counting and streaming records in JSONL files
+READ_BUFFER_SIZE = 1 << 20
+
+# Number of distinct search() results kept per adapter
+SEARCH_CACHE_SIZE = 32
+
+_MISSING = object()
+
+# datetime/date/UUID/dataclasses/numpy are encoded natively by orjson, so
+# _json_serializer only sees the remaining exotic types
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# orjson decodes integers beyond 64 bits as floats, so lines with digit runs
+# this long (e.g. 2 ** 70 saved through the json fallback) are decoded by json
+_LONG_DIGITS_RE = re.compile(rb'[0-9]{19}')
+
+
+def _has_nonfinite(value: Any) -> bool:
+    """Whether a value holds a NaN/Infinity float, which orjson writes as null."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_nonfinite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_nonfinite(v) for v in value)
+    return False
+
 
 class JSONLStorageAdapter(StorageAdapter):
     """Storage adapter for JSONL files."""
@@ -50,10 +90,31 @@ class JSONLStorageAdapter(StorageAdapter):
         
         self.logger = get_logger(__name__)
         
+        self._path = Path(filename)
+        
         # Ensure directory exists
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Whether the file exists; None until first checked (see invalidate())
+        self._exists_cache: Optional[bool] = None
         
         self._file_lock = asyncio.Lock()
+        
+        # Append handle kept open across saves (closed in close())
+        self._append_handle = None
+        
+        # ((mtime_ns, size), count) of the last counted file state
+        self._count_cache: Tuple[Optional[Tuple[int, int]], int] = (None, 0)
+        
+        # LRU of search results as raw matching lines, keyed by file state and query
+        self._search_cache: "OrderedDict[tuple, List[bytes]]" = OrderedDict()
+        
+        # orjson always emits UTF-8 without escaping; other settings use stdlib json
+        self._is_utf8 = codecs.lookup(encoding).name == 'utf-8'
+        self._use_orjson = self._is_utf8 and not ensure_ascii
+        
+        # Reusable simdjson parser for search (only touches queried fields)
+        self._parser = simdjson.Parser() if simdjson is not None and self._is_utf8 else None
     
     async def save(self, items: List[Dict[str, Any]]) -> bool:
         """Save multiple items to JSONL file."""
@@ -61,18 +122,19 @@ class JSONLStorageAdapter(StorageAdapter):
             return True
         
         try:
+            # Encode in a worker thread before taking the lock, so encoding
+            # one batch overlaps with another batch's write
+            payload = await asyncio.to_thread(self._encode_batch, items)
+            
             async with self._file_lock:
-                mode = 'w' if self.mode == 'w' else 'a'
-                async with aiofiles.open(self.filename, mode=mode, encoding=self.encoding) as f:
-                    for item in items:
-                        # Convert item to JSON string
-                        json_line = json.dumps(
-                            item,
-                            ensure_ascii=self.ensure_ascii,
-                            default=self._json_serializer,
-                            separators=(',', ':')  # Compact JSON
-                        )
-                        await f.write(json_line + '\n')
+                if self.mode == 'w':
+                    # Each save replaces the file contents
+                    async with aiofiles.open(self.filename, mode='wb') as f:
+                        await f.write(payload)
+                else:
+                    await asyncio.to_thread(self._append_sync, payload)
+                self._exists_cache = True
+                self._search_cache.clear()
                 
                 self.logger.info(f"Saved {len(items)} items to {self.filename}")
                 return True
@@ -81,43 +143,127 @@ class JSONLStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to save items to JSONL: {str(e)}", exc_info=True)
             return False
     
+    def _encode_batch(self, items: List[Dict[str, Any]]) -> bytes:
+        """Serialize items into a single newline-terminated buffer."""
+        return b'\n'.join([self._dumps(item) for item in items]) + b'\n'
+    
+    def _get_append_handle(self):
+        """Return the cached append handle, opening it on first use."""
+        if self._append_handle is None or self._append_handle.closed:
+            self._append_handle = open(self.filename, 'ab')
+        return self._append_handle
+    
+    def _append_sync(self, payload: bytes) -> None:
+        """Append payload through the cached file handle and flush it."""
+        handle = self._get_append_handle()
+        handle.write(payload)
+        handle.flush()
+    
+    def _flush_sync(self) -> None:
+        """Flush lines buffered in the append handle."""
+        if self._append_handle is not None and not self._append_handle.closed:
+            self._append_handle.flush()
+    
+    async def flush(self):
+        """Write lines buffered by save_one through to the file."""
+        async with self._file_lock:
+            self._flush_sync()
+    
+    def _exists(self) -> bool:
+        """Whether the JSONL file exists (cached after the first check)."""
+        if self._exists_cache is None:
+            self._exists_cache = self._path.is_file()
+        return self._exists_cache
+    
+    def invalidate(self):
+        """Forget cached file state, e.g. after the file was removed externally."""
+        self._exists_cache = None
+        self._count_cache = (None, 0)
+        self._search_cache.clear()
+    
+    async def close(self):
+        """Flush and close the cached append handle."""
+        if self._append_handle is not None:
+            self._append_handle.close()
+            self._append_handle = None
+    
+    def _dumps(self, item: Dict[str, Any]) -> bytes:
+        """Serialize an item to one encoded JSON line (without newline)."""
+        if self._use_orjson:
+            try:
+                data = orjson.dumps(item, default=self._json_serializer, option=_ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits, which orjson rejects
+                data = None
+            
+            if data is not None and not (b'null' in data and _has_nonfinite(item)):
+                return data
+        
+        # json keeps these values as they are (and NaN/Infinity as such)
+        return json.dumps(
+            item,
+            ensure_ascii=self.ensure_ascii,
+            default=self._json_serializer,
+            separators=(',', ':')  # Compact JSON
+        ).encode(self.encoding)
+    
+    def _loads(self, line: bytes) -> Any:
+        """
+        Parse one encoded JSON line.
+        
+        Lines with very long integers, and lines holding NaN/Infinity (which
+        orjson rejects), are decoded by json so they round-trip exactly.
+        """
+        if self._is_utf8 and _LONG_DIGITS_RE.search(line) is None:
+            try:
+                return orjson.loads(line)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(line.decode(self.encoding))
+    
     def _json_serializer(self, obj):
-        """Custom JSON serializer for non-serializable objects."""
-        if hasattr(obj, 'isoformat'):  # datetime objects
+        """Fallback for types the active encoder cannot serialize natively."""
+        if hasattr(obj, 'isoformat'):  # datetime (stdlib json), pandas Timestamp
             return obj.isoformat()
+        elif hasattr(obj, 'tolist'):  # numpy values (stdlib json)
+            return obj.tolist()
         elif hasattr(obj, '__dict__'):  # Custom objects
             return obj.__dict__
         else:
             return str(obj)
     
     async def save_one(self, item: Dict[str, Any]) -> bool:
-        """Save a single item to JSONL file."""
-        return await self.save([item])
+        """
+        Append a single item to the JSONL file.
+        
+        The line goes into the cached append handle's buffer; it is written
+        out by the next save(), flush(), close() or read operation.
+        """
+        if self.mode == 'w':
+            return await self.save([item])
+        
+        try:
+            line = self._dumps(item) + b'\n'
+            async with self._file_lock:
+                self._get_append_handle().write(line)
+                self._exists_cache = True
+                self._search_cache.clear()
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to save item to JSONL: {str(e)}", exc_info=True)
+            return False
     
     async def load(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Load items from JSONL file."""
-        if not os.path.exists(self.filename):
+        if not self._exists():
             return []
         
         try:
-            items = []
-            
+            loop = asyncio.get_running_loop()
             async with self._file_lock:
-                async with aiofiles.open(self.filename, 'r', encoding=self.encoding) as f:
-                    async for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        try:
-                            item = json.loads(line)
-                            items.append(item)
-                        except json.JSONDecodeError as e:
-                            self.logger.warning(f"Invalid JSON line: {str(e)}")
-                            continue
-                        
-                        if limit and len(items) >= limit:
-                            break
+                self._flush_sync()
+                items = await loop.run_in_executor(None, self._load_sync, limit)
             
             self.logger.info(f"Loaded {len(items)} items from {self.filename}")
             return items
@@ -126,32 +272,164 @@ class JSONLStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to load items from JSONL: {str(e)}", exc_info=True)
             return []
     
+    async def iter_items(self, limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream items from the JSONL file without loading it whole.
+        
+        The file is read and parsed in READ_BUFFER_SIZE chunks in a worker
+        thread, so memory stays bounded by one chunk. The file lock is not
+        held between items, so the consumer may write to this adapter.
+        
+        Args:
+            limit: Maximum number of items to yield
+            
+        Yields:
+            Parsed items in file order
+        """
+        if not self._exists():
+            return
+        
+        async with self._file_lock:
+            self._flush_sync()
+        
+        try:
+            f = await asyncio.to_thread(open, self.filename, 'rb')
+        except OSError as e:
+            self.logger.error(f"Failed to open JSONL file: {str(e)}")
+            return
+        
+        try:
+            pending = b''
+            eof = False
+            yielded = 0
+            
+            while not eof:
+                items, pending, eof = await asyncio.to_thread(self._read_chunk_sync, f, pending)
+                for item in items:
+                    yield item
+                    yielded += 1
+                    if limit and yielded >= limit:
+                        return
+        finally:
+            f.close()
+    
+    def _read_chunk_sync(self, f: BinaryIO, pending: bytes) -> Tuple[List[Any], bytes, bool]:
+        """
+        Read the next chunk and parse its complete lines.
+        
+        Args:
+            f: File opened in binary mode
+            pending: Partial line left over from the previous chunk
+            
+        Returns:
+            Tuple of (parsed items, new partial line, end of file reached)
+        """
+        chunk = f.read(READ_BUFFER_SIZE)
+        eof = not chunk
+        
+        lines = (pending + chunk).split(b'\n')
+        pending = b'' if eof else lines.pop()
+        
+        items = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            
+            try:
+                items.append(self._loads(line))
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"Invalid JSON line: {str(e)}")
+        
+        return items, pending, eof
+    
+    @contextmanager
+    def _mapped_lines(self):
+        """Memory-map the file read-only and yield an iterator over its lines."""
+        with open(self.filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield iter(())
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                yield iter(mm.readline, b'')
+    
+    def _load_sync(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Synchronous load operation."""
+        items = []
+        
+        with self._mapped_lines() as lines:
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                
+                try:
+                    item = self._loads(line)
+                    items.append(item)
+                except json.JSONDecodeError as e:
+                    self.logger.warning(f"Invalid JSON line: {str(e)}")
+                    continue
+                
+                if limit and len(items) >= limit:
+                    break
+        
+        return items
+    
     async def count(self) -> int:
         """Count items in JSONL file."""
-        if not os.path.exists(self.filename):
+        if not self._exists():
             return 0
         
         try:
-            count = 0
+            loop = asyncio.get_running_loop()
             async with self._file_lock:
-                async with aiofiles.open(self.filename, 'r', encoding=self.encoding) as f:
-                    async for line in f:
-                        if line.strip():  # Skip empty lines
-                            count += 1
-            
-            return count
+                self._flush_sync()
+                return await loop.run_in_executor(None, self._count_sync)
             
         except Exception as e:
             self.logger.error(f"Failed to count JSONL items: {str(e)}")
             return 0
     
+    def _count_sync(self) -> int:
+        """
+        Synchronous count operation.
+        
+        Counts newline bytes in large chunks rather than splitting lines;
+        the adapter writes exactly one newline-terminated record per item.
+        The result is cached until the file's mtime or size changes.
+        """
+        stat = os.stat(self.filename)
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._count_cache[0] == key:
+            return self._count_cache[1]
+        
+        lines = 0
+        last_chunk = b''
+        
+        with open(self.filename, 'rb', buffering=0) as f:
+            for chunk in iter(partial(f.read, READ_BUFFER_SIZE), b''):
+                lines += chunk.count(b'\n')
+                last_chunk = chunk
+        
+        if last_chunk and not last_chunk.endswith(b'\n'):
+            lines += 1  # Last record has no trailing newline
+        
+        self._count_cache = (key, lines)
+        return lines
+    
     async def clear(self) -> bool:
         """Clear all items from JSONL file."""
         try:
             async with self._file_lock:
+                self._flush_sync()
                 async with aiofiles.open(self.filename, 'w', encoding=self.encoding) as f:
                     # Create empty file
                     pass
+                self._exists_cache = True
+                self._search_cache.clear()
             
             self.logger.info(f"Cleared JSONL file: {self.filename}")
             return True
@@ -175,36 +453,14 @@ class JSONLStorageAdapter(StorageAdapter):
         Returns:
             List of matching items
         """
-        if not os.path.exists(self.filename):
+        if not self._exists():
             return []
         
         try:
-            matches = []
-            
+            loop = asyncio.get_running_loop()
             async with self._file_lock:
-                async with aiofiles.open(self.filename, 'r', encoding=self.encoding) as f:
-                    async for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        try:
-                            item = json.loads(line)
-                            
-                            # Check if item matches all query conditions
-                            is_match = True
-                            for field, value in query.items():
-                                if field not in item or item[field] != value:
-                                    is_match = False
-                                    break
-                            
-                            if is_match:
-                                matches.append(item)
-                                if limit and len(matches) >= limit:
-                                    break
-                                    
-                        except json.JSONDecodeError:
-                            continue
+                self._flush_sync()
+                matches = await loop.run_in_executor(None, self._search_sync, query, limit)
             
             self.logger.info(f"Found {len(matches)} matching items in {self.filename}")
             return matches
@@ -213,6 +469,139 @@ class JSONLStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to search JSONL file: {str(e)}")
             return []
     
+    def _search_sync(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Synchronous search operation.
+        
+        Results are cached as raw lines keyed by the file's (mtime, size) and
+        the query, so repeating a query only re-parses the matching lines.
+        """
+        cache_key = self._search_cache_key(query, limit)
+        if cache_key is not None and cache_key in self._search_cache:
+            self._search_cache.move_to_end(cache_key)
+            return [self._loads(line) for line in self._search_cache[cache_key]]
+        
+        matches = []
+        matched_lines = []
+        needles = self._search_needles(query)
+        
+        with self._mapped_lines() as lines:
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # Cheap substring prefilter; matches are verified after parsing.
+                # Lines with escapes may spell the tokens differently, so
+                # they are always parsed.
+                if needles and not all(
+                    value in line and key in line for key, value in needles
+                ) and b'\\' not in line:
+                    continue
+                
+                if self._parser is not None:
+                    try:
+                        item = self._simd_match(line, query)
+                    except ValueError:
+                        # e.g. NaN/Infinity written by json; parsed below
+                        pass
+                    else:
+                        if item is not None:
+                            matches.append(item)
+                            matched_lines.append(line)
+                            if limit and len(matches) >= limit:
+                                break
+                        continue
+                
+                try:
+                    item = self._loads(line)
+                except json.JSONDecodeError:
+                    continue
+                
+                # Check if item matches all query conditions
+                is_match = True
+                for field, value in query.items():
+                    if field not in item or item[field] != value:
+                        is_match = False
+                        break
+                
+                if is_match:
+                    matches.append(item)
+                    matched_lines.append(line)
+                    if limit and len(matches) >= limit:
+                        break
+        
+        if cache_key is not None:
+            self._search_cache[cache_key] = matched_lines
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        
+        return matches
+    
+    def _search_cache_key(self, query: Dict[str, Any], limit: Optional[int]) -> Optional[tuple]:
+        """Build the search cache key, or None if the query values are unhashable."""
+        stat = self._path.stat()
+        try:
+            return (stat.st_mtime_ns, stat.st_size, frozenset(query.items()), limit)
+        except TypeError:
+            return None
+    
+    def _search_needles(self, query: Dict[str, Any]) -> List[Tuple[bytes, bytes]]:
+        """
+        Build the raw byte tokens a matching line without escapes must contain.
+        
+        Only string/null values are used, whose serialized form is unique
+        (numbers compare equal across types). Key and value are separate
+        tokens, so lines written with any separators or key order still
+        pass; a line containing no backslash can only spell a JSON string
+        one way in UTF-8, so it can be skipped when a token is missing.
+        
+        Args:
+            query: Dictionary of field-value pairs to match
+            
+        Returns:
+            List of (key, value) tokens like (b'"field"', b'"value"')
+        """
+        if not self._is_utf8:
+            return []
+        
+        return [
+            (orjson.dumps(field), orjson.dumps(value))
+            for field, value in query.items()
+            if isinstance(field, str) and (value is None or isinstance(value, str))
+        ]
+    
+    def _simd_match(self, line: bytes, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Parse a line with simdjson and return it as a dict if it matches the query.
+        
+        Only the queried fields are materialized until the row is known to match.
+        Document proxies must not outlive this call since the parser is reused.
+        
+        Args:
+            line: Raw JSON line
+            query: Dictionary of field-value pairs to match
+            
+        Returns:
+            Matching item, or None
+        """
+        doc = self._parser.parse(line)
+        if not isinstance(doc, simdjson.Object):
+            return None
+        
+        for field, value in query.items():
+            actual = doc.get(field, _MISSING)
+            if actual is _MISSING:
+                return None
+            if isinstance(actual, simdjson.Object):
+                actual = actual.as_dict()
+            elif isinstance(actual, simdjson.Array):
+                actual = actual.as_list()
+            if actual != value:
+                return None
+        
+        return doc.as_dict()
+    
     async def filter_by_field(
         self, 
         field: str, 
@@ -237,8 +626,12 @@ class JSONLStorageAdapter(StorageAdapter):
         info = super().get_storage_info()
         
         # Add file-specific information
-        if os.path.exists(self.filename):
-            stat = os.stat(self.filename)
+        try:
+            stat = self._path.stat()
+        except OSError:
+            stat = None
+        
+        if stat is not None:
             info.update({
                 "file_size": stat.st_size,
                 "file_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
@@ -5,17 +5,124 @@ Stores data in SQLite database with dynamic table creation.
 """
 
 import json
+import math
 import os
+import re
 import sqlite3
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import AsyncIterator, Dict, List, Any, Optional, Union
 from datetime import datetime
 import threading
+from collections.abc import Mapping
+
+import orjson
 
 from .base import StorageAdapter
 from ..logger import get_logger
 
+# Field names that can be embedded verbatim in JSON paths and index names
+_SAFE_FIELD = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Item fields also stored as indexed table columns
+_INDEXED_COLUMNS = frozenset({'run_id', 'target_name'})
+
+# Rows fetched per worker-thread hop by iter_items()
+ITER_BATCH_SIZE = 1000
+
+# Applied to every connection: WAL lets readers and the writer proceed
+# concurrently (synchronous is set per adapter, NORMAL by default)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped reads
+)
+
+_SYNCHRONOUS_MODES = frozenset({'OFF', 'NORMAL', 'FULL', 'EXTRA'})
+
+# datetime/date/UUID/dataclasses/numpy are encoded natively by orjson, so
+# _json_serializer only sees the remaining exotic types
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json_path(field: str) -> str:
+    """Build a JSON path for a top-level field, quoting unusual names."""
+    return f"$.{field}" if _SAFE_FIELD.match(field) else f'$."{field}"'
+
+
+def _has_nonfinite(value: Any) -> bool:
+    """Whether a value holds a NaN/Infinity float, which orjson writes as null."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_nonfinite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_nonfinite(v) for v in value)
+    return False
+
+
+# orjson decodes integers beyond 64 bits as floats, so rows with digit runs
+# this long (e.g. 2 ** 70 saved through the json fallback) are decoded by json
+_LONG_DIGITS_RE = re.compile(r'[0-9]{19}')
+
+
+def _loads(data: str) -> Any:
+    """
+    Decode a stored row.
+    
+    Rows with very long integers, and rows holding NaN/Infinity (which
+    orjson rejects), are decoded by json so they round-trip exactly.
+    """
+    if _LONG_DIGITS_RE.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _sql_json_value(value: Any) -> Any:
+    """Render a decoded value the way SQLite's json_extract returns it."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return value
+
+
+def _is_malformed_json(error: sqlite3.OperationalError) -> bool:
+    """Whether SQLite's JSON functions failed on a row they can't parse (NaN/Infinity)."""
+    return 'malformed JSON' in str(error)
+
+
+class LazyRow(Mapping):
+    """Read-only mapping over a stored JSON row, decoded on first access."""
+    
+    __slots__ = ('_raw', '_parsed')
+    
+    def __init__(self, raw: str):
+        self._raw = raw
+        self._parsed = None
+    
+    def _data(self) -> Dict[str, Any]:
+        if self._parsed is None:
+            self._parsed = _loads(self._raw)
+        return self._parsed
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._data()[key]
+    
+    def __iter__(self):
+        return iter(self._data())
+    
+    def __len__(self) -> int:
+        return len(self._data())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the decoded row as a plain dict."""
+        return dict(self._data())
+
 
 class SQLiteStorageAdapter(StorageAdapter):
     """Storage adapter for SQLite database."""
@@ -25,7 +132,10 @@ class SQLiteStorageAdapter(StorageAdapter):
         database_url: str = "sqlite:///./data/output/hex_processor.db",
         table_name: str = "scraped_data",
         auto_create_table: bool = True,
-        primary_key: str = "id"
+        primary_key: str = "id",
+        commit_batch_size: int = 1,
+        commit_interval: float = 1.0,
+        synchronous: str = "NORMAL"
     ):
         """
         Initialize SQLite storage adapter.
@@ -35,18 +145,32 @@ class SQLiteStorageAdapter(StorageAdapter):
             table_name: Name of the table to store data
             auto_create_table: Whether to automatically create table
             primary_key: Primary key column name
+            commit_batch_size: Rows to accumulate before committing (1 commits every save);
+                a failed deferred commit keeps its rows and is reported by the
+                next save, flush or close
+            commit_interval: Seconds after which accumulated rows are committed anyway
+            synchronous: SQLite synchronous mode (OFF, NORMAL, FULL or EXTRA)
         """
         super().__init__(
             database_url=database_url,
             table_name=table_name,
             auto_create_table=auto_create_table,
-            primary_key=primary_key
+            primary_key=primary_key,
+            commit_batch_size=commit_batch_size,
+            commit_interval=commit_interval,
+            synchronous=synchronous
         )
         
         self.database_url = database_url
         self.table_name = table_name
         self.auto_create_table = auto_create_table
         self.primary_key = primary_key
+        self.commit_batch_size = commit_batch_size
+        self.commit_interval = commit_interval
+        self.synchronous = synchronous.upper()
+        
+        if self.synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid SQLite synchronous mode: {synchronous}")
         
         self.logger = get_logger(__name__)
         
@@ -62,6 +186,27 @@ class SQLiteStorageAdapter(StorageAdapter):
         # Thread lock for database operations
         self._db_lock = threading.Lock()
         
+        # Single long-lived connection, shared under _db_lock
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        # Group commit: rows saved but not yet committed, and the timer that
+        # commits them after commit_interval (only used if commit_batch_size > 1)
+        self._pending_rows: List[tuple] = []
+        self._commit_timer: Optional[threading.Timer] = None
+        
+        # Error of the last failed commit, cleared once a commit succeeds
+        self._commit_error: Optional[Exception] = None
+        
+        # SQL built once so every call reuses the same cached prepared statement
+        self._sql_insert = (
+            f"INSERT INTO {self.table_name} (data, run_id, target_name) VALUES (?, ?, ?)"
+        )
+        self._sql_load = f"SELECT data FROM {self.table_name} ORDER BY created_at DESC"
+        self._sql_load_limit = f"{self._sql_load} LIMIT ?"
+        self._sql_count = f"SELECT COUNT(*) FROM {self.table_name}"
+        self._sql_clear = f"DELETE FROM {self.table_name}"
+        self._sql_table_info = f"PRAGMA table_info({self.table_name})"
+        
         # Initialize database
         if self.auto_create_table:
             self._initialize_database()
@@ -80,6 +225,10 @@ class SQLiteStorageAdapter(StorageAdapter):
                         target_name TEXT
                     )
                 ''')
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_run_target "
+                    f"ON {self.table_name}(run_id, target_name)"
+                )
                 conn.commit()
                 
                 self.logger.info(f"SQLite database initialized: {self.db_path}")
@@ -87,9 +236,106 @@ class SQLiteStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to initialize database: {str(e)}")
             raise
     
-    def _get_connection(self):
-        """Get database connection."""
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the shared database connection, opening it on first use.
+        
+        The connection runs in autocommit mode (isolation_level=None), so
+        multi-statement writes use explicit BEGIN/COMMIT.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._conn = conn
+        return self._conn
+    
+    def _queue_rows(self, rows: List[tuple]):
+        """
+        Add rows to the pending group commit. Caller holds _db_lock.
+        
+        Rows are committed once commit_batch_size are pending, or by a timer
+        after commit_interval seconds, whichever comes first.
+        """
+        self._pending_rows.extend(rows)
+        
+        # After a failed commit, retry right away so the caller sees the outcome
+        if self._commit_error is not None or len(self._pending_rows) >= self.commit_batch_size:
+            self._commit_pending()
+        elif self._commit_timer is None:
+            self._commit_timer = threading.Timer(self.commit_interval, self._commit_pending_on_timer)
+            self._commit_timer.daemon = True
+            self._commit_timer.start()
+    
+    def _commit_pending(self):
+        """
+        Commit rows queued by group commit in one transaction. Caller holds _db_lock.
+        
+        If the commit fails the rows stay pending, the error is raised and
+        recorded, and the next save retries the commit instead of deferring.
+        """
+        if self._commit_timer is not None:
+            self._commit_timer.cancel()
+            self._commit_timer = None
+        
+        if not self._pending_rows:
+            return
+        
+        rows, self._pending_rows = self._pending_rows, []
+        try:
+            with self._get_connection() as conn:
+                conn.execute("BEGIN")
+                conn.executemany(self._sql_insert, rows)
+                conn.commit()
+        except Exception as e:
+            self._pending_rows = rows + self._pending_rows
+            self._commit_error = e
+            raise
+        
+        self._commit_error = None
+    
+    def _commit_pending_on_timer(self):
+        """Timer callback committing rows that did not fill a batch."""
+        with self._db_lock:
+            self._commit_timer = None
+            try:
+                self._commit_pending()
+            except Exception as e:
+                # Reported by the next save, flush or close, which retry the commit
+                self.logger.error(f"Failed to commit pending SQLite rows: {str(e)}")
+    
+    async def flush(self):
+        """
+        Commit rows held back by group commit.
+        
+        Raises the database error if they can't be committed; the rows stay
+        pending for the next attempt.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._flush_sync)
+    
+    def _flush_sync(self):
+        """Synchronous flush operation."""
+        with self._db_lock:
+            self._commit_pending()
+    
+    async def close(self):
+        """Commit pending rows, checkpoint the WAL and close the connection."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._close_sync)
+    
+    def _close_sync(self):
+        """Synchronous close operation."""
+        with self._db_lock:
+            if self._conn is not None:
+                try:
+                    self._commit_pending()
+                    # Fold the WAL back into the database and truncate it
+                    self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                finally:
+                    self._conn.close()
+                    self._conn = None
     
     async def save(self, items: List[Dict[str, Any]]) -> bool:
         """Save multiple items to SQLite database."""
@@ -108,23 +354,18 @@ class SQLiteStorageAdapter(StorageAdapter):
     def _save_sync(self, items: List[Dict[str, Any]]) -> bool:
         """Synchronous save operation."""
         try:
+            # Serialize outside the lock so it is held only for the inserts
+            rows = list(self._encode_rows(items))
+            
             with self._db_lock:
-                with self._get_connection() as conn:
-                    for item in items:
-                        # Convert item to JSON string
-                        data_json = json.dumps(item, default=self._json_serializer)
-                        
-                        # Extract metadata
-                        run_id = item.get('run_id')
-                        target_name = item.get('target_name')
-                        
-                        # Insert item
-                        conn.execute(f'''
-                            INSERT INTO {self.table_name} (data, run_id, target_name)
-                            VALUES (?, ?, ?)
-                        ''', (data_json, run_id, target_name))
-                    
-                    conn.commit()
+                if self.commit_batch_size > 1:
+                    self._queue_rows(rows)
+                else:
+                    with self._get_connection() as conn:
+                        # One explicit transaction for the whole batch
+                        conn.execute("BEGIN")
+                        conn.executemany(self._sql_insert, rows)
+                        conn.commit()
             
             self.logger.info(f"Saved {len(items)} items to SQLite table {self.table_name}")
             return True
@@ -133,10 +374,34 @@ class SQLiteStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to save items to SQLite: {str(e)}")
             return False
     
+    def _encode_rows(self, items: List[Dict[str, Any]]):
+        """Yield (data JSON, run_id, target_name) insert rows in one pass over items."""
+        dumps = orjson.dumps
+        default = self._json_serializer
+        option = _ORJSON_OPTIONS
+        
+        for item in items:
+            try:
+                data = dumps(item, default=default, option=option)
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits, which orjson rejects
+                data = None
+            
+            if data is None or (b'null' in data and _has_nonfinite(item)):
+                # json keeps these values as they are (and NaN/Infinity as such)
+                text = json.dumps(item, default=default, ensure_ascii=False)
+            else:
+                text = data.decode('utf-8')
+            
+            get = item.get
+            yield text, get('run_id'), get('target_name')
+    
     def _json_serializer(self, obj):
-        """Custom JSON serializer for non-serializable objects."""
-        if hasattr(obj, 'isoformat'):  # datetime objects
+        """Fallback for types the active encoder cannot serialize natively."""
+        if hasattr(obj, 'isoformat'):  # e.g. pandas Timestamp, datetime (json)
             return obj.isoformat()
+        elif hasattr(obj, 'tolist'):  # numpy values (json)
+            return obj.tolist()
         elif hasattr(obj, '__dict__'):  # Custom objects
             return obj.__dict__
         else:
@@ -144,7 +409,28 @@ class SQLiteStorageAdapter(StorageAdapter):
     
     async def save_one(self, item: Dict[str, Any]) -> bool:
         """Save a single item to SQLite database."""
-        return await self.save([item])
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._save_one_sync, item)
+        except Exception as e:
+            self.logger.error(f"Failed to save item to SQLite: {str(e)}", exc_info=True)
+            return False
+    
+    def _save_one_sync(self, item: Dict[str, Any]) -> bool:
+        """Synchronous single-row insert (autocommits, no explicit transaction)."""
+        try:
+            row = next(self._encode_rows([item]))
+            
+            with self._db_lock:
+                if self.commit_batch_size > 1:
+                    self._queue_rows([row])
+                else:
+                    self._get_connection().execute(self._sql_insert, row)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to save item to SQLite: {str(e)}")
+            return False
     
     async def load(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Load items from SQLite database."""
@@ -162,18 +448,17 @@ class SQLiteStorageAdapter(StorageAdapter):
             items = []
             
             with self._db_lock:
+                self._commit_pending()
                 with self._get_connection() as conn:
-                    query = f"SELECT data FROM {self.table_name} ORDER BY created_at DESC"
-                    
                     if limit:
-                        query += f" LIMIT {limit}"
-                    
-                    cursor = conn.execute(query)
+                        cursor = conn.execute(self._sql_load_limit, (limit,))
+                    else:
+                        cursor = conn.execute(self._sql_load)
                     rows = cursor.fetchall()
                     
                     for row in rows:
                         try:
-                            item = json.loads(row[0])
+                            item = _loads(row[0])
                             items.append(item)
                         except json.JSONDecodeError as e:
                             self.logger.warning(f"Invalid JSON in database: {str(e)}")
@@ -186,6 +471,148 @@ class SQLiteStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to load items from SQLite: {str(e)}")
             return []
     
+    async def iter_items(self, limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream items from the table without fetching all rows.
+        
+        Rows are fetched and decoded in batches of ITER_BATCH_SIZE from an
+        open cursor; the database lock is only held while fetching a batch.
+        
+        Args:
+            limit: Maximum number of items to yield
+            
+        Yields:
+            Stored items, newest first
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            cursor = await loop.run_in_executor(None, self._open_load_cursor, limit)
+        except Exception as e:
+            self.logger.error(f"Failed to load items from SQLite: {str(e)}", exc_info=True)
+            return
+        
+        try:
+            while True:
+                items = await loop.run_in_executor(None, self._fetch_items_sync, cursor)
+                if not items:
+                    break
+                for item in items:
+                    yield item
+        finally:
+            await loop.run_in_executor(None, self._close_cursor_sync, cursor)
+    
+    def _open_load_cursor(self, limit: Optional[int] = None) -> sqlite3.Cursor:
+        """Start the load query and return its cursor."""
+        with self._db_lock:
+            self._commit_pending()
+            conn = self._get_connection()
+            if limit:
+                return conn.execute(self._sql_load_limit, (limit,))
+            return conn.execute(self._sql_load)
+    
+    def _fetch_items_sync(self, cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """Fetch and decode the next batch of rows (empty when exhausted)."""
+        items = []
+        
+        with self._db_lock:
+            rows = cursor.fetchmany(ITER_BATCH_SIZE)
+        
+        for (data,) in rows:
+            try:
+                items.append(_loads(data))
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"Invalid JSON in database: {str(e)}")
+        
+        return items
+    
+    def _close_cursor_sync(self, cursor: sqlite3.Cursor):
+        """Release a cursor opened by _open_load_cursor."""
+        with self._db_lock:
+            cursor.close()
+    
+    async def load_lazy(self, limit: Optional[int] = None) -> List[LazyRow]:
+        """
+        Load rows without decoding them up front.
+        
+        Each row is a LazyRow that parses its JSON on first access, which is
+        cheaper when callers only look at a few rows or fields. Use load()
+        when plain dicts are needed (e.g. to save into another adapter).
+        
+        Args:
+            limit: Maximum number of rows
+            
+        Returns:
+            List of lazily decoded rows
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._load_lazy_sync, limit)
+        except Exception as e:
+            self.logger.error(f"Failed to load items from SQLite: {str(e)}", exc_info=True)
+            return []
+    
+    def _load_lazy_sync(self, limit: Optional[int] = None) -> List[LazyRow]:
+        """Synchronous lazy load operation."""
+        if limit:
+            query, params = self._sql_load_limit, (limit,)
+        else:
+            query, params = self._sql_load, ()
+        
+        with self._db_lock:
+            self._commit_pending()
+            with self._get_connection() as conn:
+                return [LazyRow(data) for (data,) in conn.execute(query, params)]
+    
+    async def scan(self, fields: List[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Load only the given fields of each item, projected in SQL.
+        
+        Fields are extracted with json_extract, so rows are never decoded in
+        Python; nested objects/arrays come back as JSON text.
+        
+        Args:
+            fields: Field names to project
+            limit: Maximum number of rows
+            
+        Returns:
+            List of dicts containing only the requested fields
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._scan_sync, list(fields), limit)
+        except Exception as e:
+            self.logger.error(f"Failed to scan SQLite table: {str(e)}", exc_info=True)
+            return []
+    
+    def _scan_sync(self, fields: List[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Synchronous scan operation."""
+        if not fields:
+            return []
+        
+        columns = ", ".join("json_extract(data, ?)" for _ in fields)
+        query = f"SELECT {columns} FROM {self.table_name} ORDER BY created_at DESC"
+        params: List[Any] = [_json_path(field) for field in fields]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._db_lock:
+            self._commit_pending()
+            with self._get_connection() as conn:
+                try:
+                    return [dict(zip(fields, row)) for row in conn.execute(query, params)]
+                except sqlite3.OperationalError as e:
+                    if not _is_malformed_json(e):
+                        raise
+                
+                # Some rows hold NaN/Infinity; project every row in Python instead
+                rows = conn.execute(self._sql_load_limit, (limit,)) if limit else conn.execute(self._sql_load)
+                projected = []
+                for (data,) in rows:
+                    item = _loads(data)
+                    projected.append({field: _sql_json_value(item.get(field)) for field in fields})
+                return projected
+    
     async def count(self) -> int:
         """Count items in SQLite table."""
         try:
@@ -200,8 +627,9 @@ class SQLiteStorageAdapter(StorageAdapter):
         """Synchronous count operation."""
         try:
             with self._db_lock:
+                self._commit_pending()
                 with self._get_connection() as conn:
-                    cursor = conn.execute(f"SELECT COUNT(*) FROM {self.table_name}")
+                    cursor = conn.execute(self._sql_count)
                     result = cursor.fetchone()
                     return result[0] if result else 0
         except Exception as e:
@@ -222,8 +650,9 @@ class SQLiteStorageAdapter(StorageAdapter):
         """Synchronous clear operation."""
         try:
             with self._db_lock:
+                self._commit_pending()
                 with self._get_connection() as conn:
-                    conn.execute(f"DELETE FROM {self.table_name}")
+                    conn.execute(self._sql_clear)
                     conn.commit()
             
             self.logger.info(f"Cleared SQLite table {self.table_name}")
@@ -257,39 +686,49 @@ class SQLiteStorageAdapter(StorageAdapter):
             return []
     
     def _search_sync(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Synchronous search operation."""
+        """
+        Synchronous search operation.
+        
+        run_id/target_name use their indexed columns; other scalar
+        predicates on plain field names run in SQL via json_extract (using
+        the index from create_search_index, if any); None/container values and unusual field
+        names are matched in Python after decoding.
+        """
         try:
-            matches = []
+            clauses = []
+            params: List[Any] = []
+            residual = {}
+            
+            for field, value in query.items():
+                if field in _INDEXED_COLUMNS and isinstance(value, str):
+                    # Metadata mirrored into indexed columns on insert
+                    clauses.append(f"{field} = ?")
+                    params.append(value)
+                elif isinstance(value, (str, int, float)) and _SAFE_FIELD.match(field):
+                    clauses.append(f"json_extract(data, '$.{field}') = ?")
+                    params.append(value)
+                else:
+                    residual[field] = value
+            
+            sql_query = f"SELECT data FROM {self.table_name}"
+            if clauses:
+                sql_query += " WHERE " + " AND ".join(clauses)
+            sql_query += " ORDER BY created_at DESC"
+            
+            if limit and not residual:
+                sql_query += " LIMIT ?"
+                params.append(limit)
             
             with self._db_lock:
+                self._commit_pending()
                 with self._get_connection() as conn:
-                    # Get all data and filter in Python (SQLite doesn't have JSON query support by default)
-                    sql_query = f"SELECT data FROM {self.table_name} ORDER BY created_at DESC"
-                    
-                    if limit:
-                        sql_query += f" LIMIT {limit * 2}"  # Get more items to filter
-                    
-                    cursor = conn.execute(sql_query)
-                    rows = cursor.fetchall()
-                    
-                    for row in rows:
-                        try:
-                            item = json.loads(row[0])
-                            
-                            # Check if item matches all query conditions
-                            is_match = True
-                            for field, value in query.items():
-                                if field not in item or item[field] != value:
-                                    is_match = False
-                                    break
-                            
-                            if is_match:
-                                matches.append(item)
-                                if limit and len(matches) >= limit:
-                                    break
-                                    
-                        except json.JSONDecodeError:
-                            continue
+                    try:
+                        matches = self._match_rows(conn.execute(sql_query, params), residual, limit)
+                    except sqlite3.OperationalError as e:
+                        if not _is_malformed_json(e):
+                            raise
+                        # Some rows hold NaN/Infinity; match every row in Python instead
+                        matches = self._match_rows(conn.execute(self._sql_load), query, limit)
             
             self.logger.info(f"Found {len(matches)} matching items in SQLite table {self.table_name}")
             return matches
@@ -298,6 +737,71 @@ class SQLiteStorageAdapter(StorageAdapter):
             self.logger.error(f"Failed to search SQLite table: {str(e)}")
             return []
     
+    def _match_rows(self, rows, residual: Dict[str, Any], limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Decode (data,) rows and keep those matching the residual conditions."""
+        matches = []
+        
+        for (data,) in rows:
+            try:
+                item = _loads(data)
+            except json.JSONDecodeError:
+                continue
+            
+            # Check remaining conditions in Python
+            is_match = True
+            for field, value in residual.items():
+                if field not in item or item[field] != value:
+                    is_match = False
+                    break
+            
+            if is_match:
+                matches.append(item)
+                if limit and len(matches) >= limit:
+                    break
+        
+        return matches
+    
+    async def create_search_index(self, field: str) -> bool:
+        """
+        Create an expression index for searching a JSON field.
+        
+        search() uses it for scalar predicates on the field. Indexes persist
+        in the database and add work to every insert, so they are only
+        created on request.
+        
+        Args:
+            field: Top-level field name (letters, digits and underscores)
+            
+        Returns:
+            True if the index exists afterwards
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._create_search_index_sync, field)
+        except Exception as e:
+            self.logger.error(f"Failed to create SQLite search index: {str(e)}")
+            return False
+    
+    def _create_search_index_sync(self, field: str) -> bool:
+        """Synchronous index creation."""
+        if not _SAFE_FIELD.match(field):
+            self.logger.error(f"Cannot index field with unsupported name: {field}")
+            return False
+        
+        try:
+            with self._db_lock:
+                self._get_connection().execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_json_{field} "
+                    f"ON {self.table_name}(json_extract(data, '$.{field}'))"
+                )
+            
+            self.logger.info(f"Created search index on field '{field}' of SQLite table {self.table_name}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to create SQLite search index: {str(e)}")
+            return False
+    
     async def get_table_info(self) -> Dict[str, Any]:
         """Get information about the SQLite table."""
         try:
@@ -312,11 +816,12 @@ class SQLiteStorageAdapter(StorageAdapter):
         """Synchronous table info operation."""
         try:
             with self._db_lock:
+                self._commit_pending()
                 with self._get_connection() as conn:
-                    cursor = conn.execute(f"PRAGMA table_info({self.table_name})")
+                    cursor = conn.execute(self._sql_table_info)
                     columns = cursor.fetchall()
                     
-                    cursor = conn.execute(f"SELECT COUNT(*) FROM {self.table_name}")
+                    cursor = conn.execute(self._sql_count)
                     count = cursor.fetchone()[0]
                     
                     return {
@@ -5,13 +5,28 @@ Handles field mapping, type conversions, and custom transformations.
 """
 
 import ast
+import multiprocessing
+import os
 import re
-from typing import Dict, List, Any, Optional, Callable, Union
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from types import CodeType, FunctionType
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
 from datetime import datetime, date
 import json
 
+import numpy as np
+import orjson
+import pandas as pd
+
 from .logger import get_logger, log_function_call
 from .config import TransformerConfig
+from .utils import chunk_list, parse_iso_datetime
+
+
+# Integers up to this magnitude survive a round trip through float64
+_EXACT_INT_LIMIT = 2 ** 53
 
 
 class TransformationError(Exception):
@@ -19,6 +34,181 @@ class TransformationError(Exception):
     pass
 
 
+def _to_int(value: Any) -> int:
+    """Convert to int, accepting numeric strings like '3.0'."""
+    return int(float(value)) if isinstance(value, str) else int(value)
+
+
+_BOOL_TRUE = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert to bool, treating 'true'/'1'/'yes'/'on' strings as True."""
+    if isinstance(value, str):
+        return value.lower() in _BOOL_TRUE
+    return bool(value)
+
+
+def _loads_json(value: str) -> Any:
+    """
+    Parse a JSON string with orjson, re-parsing with json when orjson rejects it.
+    
+    json accepts NaN, Infinity and lone surrogates, which orjson rejects, and
+    raises the same errors as before for invalid input. Integers beyond 64
+    bits are read as floats by orjson.
+    """
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return json.loads(value)
+
+
+def _to_array(value: Any) -> list:
+    """Convert to list from a JSON array, comma-separated string or scalar."""
+    if isinstance(value, str):
+        # Try to parse as JSON array
+        try:
+            parsed = _loads_json(value)
+            if isinstance(parsed, list):
+                return parsed
+        except:
+            pass
+        # Split by comma if not JSON
+        return [item.strip() for item in value.split(',')]
+    elif isinstance(value, (list, tuple)):
+        return list(value)
+    else:
+        return [value]
+
+
+def _to_dict(value: Any) -> dict:
+    """Convert to dict from a JSON object string or by wrapping the value."""
+    if isinstance(value, str):
+        return _loads_json(value)
+    elif isinstance(value, dict):
+        return value
+    else:
+        return {"value": value}
+
+
+# Tried in order after the parse_iso_datetime fast path (the ISO formats
+# stay for variants it rejects, such as single-digit months)
+_DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y'
+)
+
+# No directive in these formats matches '/', so only the formats with a
+# literal '/' can match a value containing one (and vice versa); each group
+# keeps the order above
+_SLASH_DATETIME_FORMATS = tuple(fmt for fmt in _DATETIME_FORMATS if '/' in fmt)
+_DASH_DATETIME_FORMATS = tuple(fmt for fmt in _DATETIME_FORMATS if '/' not in fmt)
+
+
+@lru_cache(maxsize=65536)
+def _parse_datetime_string(value: str) -> Union[datetime, str]:
+    """
+    Parse a datetime string, returning it unchanged if no format matches.
+    
+    Cached because date columns repeat values heavily; both possible
+    results (datetime or the input str) are immutable, so sharing is safe.
+    """
+    if '/' in value:
+        formats = _SLASH_DATETIME_FORMATS
+    else:
+        parsed = parse_iso_datetime(value, allow_utc_suffix=False)
+        if parsed is not None:
+            return parsed
+        formats = _DASH_DATETIME_FORMATS
+    
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return value
+
+
+def _to_datetime(value: Any) -> Any:
+    """Parse a datetime string; unparseable strings and other values pass through."""
+    if isinstance(value, str):
+        return _parse_datetime_string(value)
+    return value
+
+
+# Converters by lower-cased target type name
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "string": str,
+    "int": _to_int,
+    "float": float,
+    "bool": _to_bool,
+    "array": _to_array,
+    "dict": _to_dict,
+    "datetime": _to_datetime,
+}
+
+
+# AST nodes permitted in evaluate_expression (operators are allowed by base class)
+_ALLOWED_EXPRESSION_NODES = (
+    ast.Expression, ast.Constant, ast.Name, ast.Load, ast.Attribute, ast.Subscript,
+    ast.Slice, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.Call, ast.keyword, ast.List, ast.Tuple, ast.Dict, ast.Set,
+    ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp, ast.comprehension, ast.Store,
+    ast.JoinedStr, ast.FormattedValue,
+    ast.operator, ast.unaryop, ast.boolop, ast.cmpop,
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr_str: str) -> CodeType:
+    """
+    Parse, validate and compile an expression once per distinct source string.
+    
+    Only whitelisted node types are accepted, and names/attributes starting
+    with an underscore are rejected (blocks dunder-based sandbox escapes).
+    """
+    tree = ast.parse(expr_str, mode='eval')
+    
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_EXPRESSION_NODES):
+            raise ValueError(f"Disallowed syntax: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id.startswith('_'):
+            raise ValueError(f"Disallowed name: {node.id}")
+        if isinstance(node, ast.Attribute) and node.attr.startswith('_'):
+            raise ValueError(f"Disallowed attribute: {node.attr}")
+    
+    return compile(tree, '<expression>', 'eval')
+
+
+@lru_cache(maxsize=1024)
+def _compile_lambda(lambda_str: str) -> CodeType:
+    """
+    Parse, validate and compile a lambda once per distinct source string.
+    
+    Names and attributes starting with a double underscore are rejected
+    (blocks dunder-based sandbox escapes such as ().__class__.__bases__).
+    """
+    if not lambda_str.strip().startswith('lambda'):
+        raise ValueError("Expression must start with 'lambda'")
+    
+    tree = ast.parse(lambda_str, '<custom>', mode='eval')
+    
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id.startswith('__'):
+            raise ValueError(f"Disallowed name: {node.id}")
+        if isinstance(node, ast.Attribute) and node.attr.startswith('__'):
+            raise ValueError(f"Disallowed attribute: {node.attr}")
+    
+    return compile(tree, '<custom>', 'eval')
+
+
+# Expression bytecode of a bare lambda: load its code, make the function, return
+_BARE_LAMBDA = compile('lambda: None', '<custom>', 'eval')
+
+
 class SafeEvaluator:
     """Safe Python expression evaluator for custom functions."""
     
@@ -59,6 +249,25 @@ class SafeEvaluator:
         're': re,
     }
     
+    # Read-only globals shared by every evaluation (per-item values go in locals)
+    _BASE_GLOBALS = {
+        '__builtins__': ALLOWED_BUILTINS,
+        **ALLOWED_DATETIME,
+        **ALLOWED_STRING,
+    }
+    
+    # Per-thread copies of _BASE_GLOBALS for lambdas, which read 'item' as a global
+    _thread_globals = threading.local()
+    
+    @classmethod
+    def _get_globals(cls) -> Dict[str, Any]:
+        """Return this thread's lambda globals dict, created on first use."""
+        safe_globals = getattr(cls._thread_globals, 'namespace', None)
+        if safe_globals is None:
+            safe_globals = cls._BASE_GLOBALS.copy()
+            cls._thread_globals.namespace = safe_globals
+        return safe_globals
+    
     @classmethod
     def evaluate_lambda(cls, lambda_str: str, item: Dict[str, Any]) -> Any:
         """
@@ -72,26 +281,80 @@ class SafeEvaluator:
             Result of lambda evaluation
         """
         try:
-            # Parse the lambda expression
-            if not lambda_str.strip().startswith('lambda'):
-                raise ValueError("Expression must start with 'lambda'")
+            # Parse, check and compile once per distinct lambda string
+            code = _compile_lambda(lambda_str)
             
-            # Create a safe evaluation environment
-            safe_globals = {
-                '__builtins__': cls.ALLOWED_BUILTINS,
-                **cls.ALLOWED_DATETIME,
-                **cls.ALLOWED_STRING,
-                'item': item
-            }
+            # Reuse this thread's safe globals, binding only the item
+            safe_globals = cls._get_globals()
+            safe_globals['item'] = item
+            try:
+                # Evaluate and execute the lambda
+                func = eval(code, safe_globals)
+                return func()
+            finally:
+                safe_globals.pop('item', None)
             
-            # Evaluate the lambda
-            func = eval(lambda_str, safe_globals)
+        except Exception as e:
+            raise TransformationError(f"Failed to evaluate lambda '{lambda_str}': {str(e)}")
+    
+    @classmethod
+    def compile_lambda(cls, lambda_str: str) -> CodeType:
+        """
+        Compile a lambda expression once for repeated evaluation.
+        
+        Args:
+            lambda_str: Lambda expression as string
             
-            # Execute the lambda
-            return func()
+        Returns:
+            Code object for evaluate_compiled
+        """
+        try:
+            return _compile_lambda(lambda_str)
+        except (SyntaxError, ValueError) as e:
+            raise TransformationError(f"Failed to compile lambda '{lambda_str}': {str(e)}")
+    
+    @classmethod
+    def evaluate_compiled(cls, code: CodeType, item: Dict[str, Any]) -> Any:
+        """
+        Evaluate a lambda compiled by compile_lambda against an item.
+        
+        Args:
+            code: Compiled lambda expression
+            item: Data item to transform
             
+        Returns:
+            Result of lambda evaluation
+        """
+        try:
+            safe_globals = cls._get_globals()
+            safe_globals['item'] = item
+            try:
+                return eval(code, safe_globals)()
+            finally:
+                safe_globals.pop('item', None)
         except Exception as e:
-            raise TransformationError(f"Failed to evaluate lambda '{lambda_str}': {str(e)}")
+            raise TransformationError(f"Failed to evaluate lambda: {str(e)}")
+    
+    @classmethod
+    def bind_compiled(cls, code: CodeType) -> Callable[[], Any]:
+        """
+        Turn a lambda compiled by compile_lambda into a reusable callable.
+        
+        The callable is bound to this thread's globals and reads whatever
+        'item' is bound there when called. A bare lambda (no defaults) is
+        built into a function once; anything else is re-evaluated per call.
+        
+        Args:
+            code: Compiled lambda expression
+            
+        Returns:
+            Zero-argument callable returning the lambda's result
+        """
+        safe_globals = cls._get_globals()
+        if code.co_code == _BARE_LAMBDA.co_code and not code.co_names:
+            # Same function eval(code, safe_globals) would create
+            return FunctionType(code.co_consts[0], safe_globals)
+        return lambda: eval(code, safe_globals)()
     
     @classmethod
     def evaluate_expression(cls, expr_str: str, item: Dict[str, Any]) -> Any:
@@ -106,27 +369,34 @@ class SafeEvaluator:
             Result of expression evaluation
         """
         try:
-            # Create a safe evaluation environment
-            safe_globals = {
-                '__builtins__': cls.ALLOWED_BUILTINS,
-                **cls.ALLOWED_DATETIME,
-                **cls.ALLOWED_STRING,
-                'item': item
-            }
+            code = _compile_expression(expr_str)
             
-            # Add item fields as variables
-            safe_locals = {k: v for k, v in item.items() if isinstance(k, str)}
+            # Item fields as variables, plus the item itself
+            namespace = {'item': item, **item}
             
-            # Evaluate the expression
-            return eval(expr_str, safe_globals, safe_locals)
+            return eval(code, cls._BASE_GLOBALS, namespace)
             
         except Exception as e:
             raise TransformationError(f"Failed to evaluate expression '{expr_str}': {str(e)}")
 
 
+def _transform_chunk(config: TransformerConfig, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Transform one chunk in a worker process (see DataTransformer.transform_data_parallel)."""
+    return DataTransformer(config)._transform_items(items, config)
+
+
+def _get_process_context():
+    """Prefer fork, which skips re-importing modules in every worker."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
 class DataTransformer:
     """Data transformer with field mapping, type conversion, and custom functions."""
     
+    __slots__ = ('config', 'logger', 'custom_functions', '_compiled_functions', '_resolved_conversions')
+    
     def __init__(self, config: Optional[TransformerConfig] = None):
         """Initialize data transformer with configuration."""
         self.config = config or TransformerConfig()
@@ -134,6 +404,10 @@ class DataTransformer:
         
         # Compile custom functions
         self.custom_functions = {}
+        self._compiled_functions: Dict[str, CodeType] = {}
+        
+        # (mapping object, snapshot, resolved converters) of the last type_conversions seen
+        self._resolved_conversions: Tuple[Optional[Dict[str, str]], Dict[str, str], list] = (None, {}, [])
         if self.config.custom_functions:
             self._compile_custom_functions()
     
@@ -141,12 +415,20 @@ class DataTransformer:
         """Compile custom functions from configuration."""
         for name, func_str in self.config.custom_functions.items():
             try:
-                # Store the lambda string for later evaluation
                 self.custom_functions[name] = func_str
+                self._get_compiled_function(func_str)
                 self.logger.debug(f"Compiled custom function: {name}")
             except Exception as e:
                 self.logger.error(f"Failed to compile custom function '{name}': {str(e)}")
     
+    def _get_compiled_function(self, func_str: str) -> CodeType:
+        """Return the compiled form of a lambda string, compiling it on first use."""
+        compiled = self._compiled_functions.get(func_str)
+        if compiled is None:
+            compiled = SafeEvaluator.compile_lambda(func_str)
+            self._compiled_functions[func_str] = compiled
+        return compiled
+    
     @log_function_call()
     def transform_data(
         self,
@@ -164,41 +446,341 @@ class DataTransformer:
             List of transformed items
         """
         config = transform_config or self.config
-        transformed_items = []
         
         self.logger.info(f"Starting data transformation for {len(items)} items")
         
+        transformed_items = self._transform_items(items, config)
+        
+        self.logger.info(f"Data transformation completed for {len(transformed_items)} items")
+        
+        return transformed_items
+    
+    @log_function_call()
+    def transform_data_parallel(
+        self,
+        items: List[Dict[str, Any]],
+        transform_config: Optional[TransformerConfig] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Transform a list of data items across worker processes.
+        
+        Items are split into chunks of chunk_size and each chunk is transformed
+        by a DataTransformer rebuilt from the config in a worker process, so
+        custom function evaluation runs on several cores. Results keep input
+        order and match transform_data. Batches that fit in one chunk, a single
+        worker, or a failing pool use transform_data in this process.
+        
+        Args:
+            items: List of data items to transform
+            transform_config: Optional override config
+            workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Number of items sent to a worker at a time
+            
+        Returns:
+            List of transformed items
+        """
+        config = transform_config or self.config
+        workers = workers or os.cpu_count() or 1
+        chunks = chunk_list(items, chunk_size)
+        workers = min(workers, len(chunks))
+        
+        if workers <= 1:
+            return self.transform_data(items, config)
+        
+        self.logger.info(f"Starting parallel data transformation for {len(items)} items "
+                         f"({len(chunks)} chunks, {workers} workers)")
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_get_process_context()) as executor:
+                results = executor.map(_transform_chunk, [config] * len(chunks), chunks)
+                transformed_items = [item for chunk in results for item in chunk]
+        except Exception as e:
+            self.logger.warning(f"Parallel transformation failed, transforming in process: {str(e)}")
+            return self.transform_data(items, config)
+        
+        self.logger.info(f"Parallel data transformation completed for {len(transformed_items)} items")
+        
+        return transformed_items
+    
+    def _transform_items(self, items: List[Dict[str, Any]], config: TransformerConfig) -> List[Dict[str, Any]]:
+        """Transform items one by one, keeping the original item if one fails."""
+        transformed_items = []
+        
+        # Resolve the config once for the whole batch rather than per item
+        plan = self._prepare_transform(config)
+        transform_item = self._transform_item
+        
+        # Rename-only (or empty) configs skip the per-item stage dispatch;
+        # if an item can't be mapped, redo the batch item by item below
+        field_mapping, conversions, functions = plan
+        if not conversions and not functions:
+            apply_field_mapping = self._apply_field_mapping
+            try:
+                return [apply_field_mapping(item, field_mapping) for item in items]
+            except Exception:
+                pass
+        
         for item in items:
             try:
-                transformed_item = self._transform_item(item, config)
+                transformed_item = transform_item(item, config, plan)
                 transformed_items.append(transformed_item)
             except Exception as e:
                 self.logger.error(f"Failed to transform item: {str(e)}", exc_info=True)
                 # Include original item if transformation fails
                 transformed_items.append(item)
         
-        self.logger.info(f"Data transformation completed for {len(transformed_items)} items")
+        return transformed_items
+    
+    @log_function_call()
+    def transform_data_columnar(
+        self,
+        items: List[Dict[str, Any]],
+        transform_config: Optional[TransformerConfig] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Transform a list of data items column-at-a-time with pandas.
+        
+        Produces the same items as transform_data for homogeneous input (every
+        item has the same keys): field mapping becomes a column rename, int and
+        float conversions run as vectorized casts, and other conversions are
+        dispatched once per column. Heterogeneous items, colliding field
+        mappings or unexpected errors fall back to transform_data.
+        
+        Args:
+            items: List of data items to transform
+            transform_config: Optional override config
+            
+        Returns:
+            List of transformed items
+        """
+        config = transform_config or self.config
+        if not items:
+            return []
+        
+        try:
+            # Missing keys would come back as NaN instead of being absent
+            fields = list(items[0])
+            width = len(fields)
+            if not all(len(item) == width for item in items):
+                return self.transform_data(items, config)
+            
+            try:
+                data = {field: [item[field] for item in items] for field in fields}
+            except KeyError:
+                # Same number of keys but different key sets
+                return self.transform_data(items, config)
+            df = pd.DataFrame(data, dtype=object)
+            
+            if config.field_mapping:
+                df = self._rename_columns(df, config.field_mapping)
+                if df is None:
+                    return self.transform_data(items, config)
+            
+            self.logger.info(f"Starting columnar data transformation for {len(items)} items")
+            
+            for field, target_type in config.type_conversions.items():
+                if field in df.columns:
+                    df[field] = self._convert_column(df[field], field, target_type)
+            
+            # Rebuild records from column lists (much cheaper than to_dict('records'))
+            fields = list(df.columns)
+            columns = [df[field].to_numpy().tolist() for field in fields]
+            transformed_items = [dict(zip(fields, row)) for row in zip(*columns)]
+            
+        except Exception as e:
+            self.logger.warning(f"Columnar transformation failed, using per-item path: {str(e)}")
+            return self.transform_data(items, config)
+        
+        if config.custom_functions:
+            # Rows are already mapped and converted; only run the custom functions
+            plan = ({}, [], self._prepare_transform(config)[2])
+            transform_item = self._transform_item
+            transformed_items = [transform_item(item, config, plan) for item in transformed_items]
+        
+        self.logger.info(f"Columnar data transformation completed for {len(transformed_items)} items")
         
         return transformed_items
     
-    def _transform_item(self, item: Dict[str, Any], config: TransformerConfig) -> Dict[str, Any]:
-        """Transform a single data item."""
-        # Apply field mapping
-        mapped_item = self._apply_field_mapping(item, config.field_mapping)
+    def _rename_columns(self, df: pd.DataFrame, field_mapping: Dict[str, str]) -> Optional[pd.DataFrame]:
+        """
+        Apply field mapping to DataFrame columns, ordered like _apply_field_mapping.
         
-        # Apply type conversions
-        typed_item = self._apply_type_conversions(mapped_item, config.type_conversions)
+        Returns None if renamed columns would collide, which the per-item path
+        resolves by overwriting.
+        """
+        mapped = [old for old in field_mapping if old in df.columns]
+        rest = [field for field in df.columns if field not in field_mapping]
+        names = [field_mapping[old] for old in mapped] + rest
         
-        # Apply custom functions
-        final_item = self._apply_custom_functions(typed_item, config.custom_functions)
+        if len(set(names)) != len(names):
+            return None
         
-        return final_item
+        df = df[mapped + rest]
+        df.columns = names
+        return df
+    
+    def _convert_column(self, column: pd.Series, field: str, target_type: str) -> pd.Series:
+        """Convert the non-None values of a column, matching _apply_type_conversions."""
+        values = column.to_numpy()
+        mask = values != None  # noqa: E711 - elementwise comparison
+        if not mask.any():
+            return column
+        
+        kind = target_type.lower()
+        if kind in ("int", "float"):
+            try:
+                # float64 casts of objects go through float() per value, so
+                # results match _convert_type exactly (pd.to_numeric does not)
+                numeric = values[mask].astype(np.float64)
+                if kind == "int":
+                    # int(float(x)) only agrees with a float64 cast while exact
+                    if not (np.isfinite(numeric).all() and (np.abs(numeric) < _EXACT_INT_LIMIT).all()):
+                        raise ValueError("values outside the exact float64 integer range")
+                    numeric = numeric.astype(np.int64)
+                converted = values.copy()
+                converted[mask] = numeric.tolist()
+                return pd.Series(converted, index=column.index, dtype=object)
+            except (ValueError, TypeError, OverflowError):
+                pass  # Mixed or unusual values: convert one by one below
+        
+        # Resolve the converter once for the column instead of per value
+        converter = _CONVERTERS.get(kind)
+        if converter is None:
+            return column
+        
+        try:
+            if kind == "bool":
+                # _to_bool inlined; the call per value dominates for flag columns
+                converted = [
+                    None if value is None else
+                    value.lower() in _BOOL_TRUE if isinstance(value, str) else bool(value)
+                    for value in values.tolist()
+                ]
+            else:
+                converted = [None if value is None else converter(value) for value in values.tolist()]
+            return pd.Series(converted, index=column.index, dtype=object)
+        except Exception:
+            pass  # Some value failed: convert one by one below, logging each failure
+        
+        def convert_value(value: Any) -> Any:
+            if value is None:
+                return None
+            try:
+                return converter(value)
+            except Exception as e:
+                self.logger.warning(
+                    f"Type conversion failed for field '{field}': "
+                    f"Failed to convert {value} to {target_type}: {str(e)}"
+                )
+                return value
+        
+        return pd.Series([convert_value(value) for value in values], index=column.index, dtype=object)
+    
+    def _prepare_transform(self, config: TransformerConfig) -> Tuple[Dict[str, str], list, list]:
+        """
+        Resolve a config into what _transform_item needs per item.
+        
+        Returns the field mapping, the resolved type converters and
+        (field name, callable, compile error) for each custom function. The
+        callables are bound to the calling thread's evaluator globals.
+        """
+        conversions = self._resolve_type_conversions(config.type_conversions) if config.type_conversions else []
+        
+        functions = []
+        for field_name, func_str in config.custom_functions.items():
+            try:
+                code = self._get_compiled_function(func_str)
+                functions.append((field_name, SafeEvaluator.bind_compiled(code), None))
+            except Exception as e:
+                functions.append((field_name, None, str(e)))
+        
+        return config.field_mapping, conversions, functions
+    
+    def _transform_item(
+        self,
+        item: Dict[str, Any],
+        config: TransformerConfig,
+        plan: Optional[Tuple[Dict[str, str], list, list]] = None
+    ) -> Dict[str, Any]:
+        """
+        Transform a single data item.
+        
+        Equivalent to _apply_field_mapping, _apply_type_conversions and
+        _apply_custom_functions in sequence, but all three stages write into
+        a single output dict instead of copying the item at every stage.
+        
+        Args:
+            item: Data item to transform
+            config: Transformer configuration
+            plan: Result of _prepare_transform(config), when transforming a batch
+            
+        Returns:
+            Transformed item
+        """
+        field_mapping, conversions, functions = plan or self._prepare_transform(config)
+        
+        # Apply field mapping (mapped fields first, then the rest, as before)
+        if field_mapping:
+            output = {}
+            for old_field, new_field in field_mapping.items():
+                if old_field in item:
+                    output[new_field] = item[old_field]
+            for field, value in item.items():
+                if field not in field_mapping:
+                    output[field] = value
+        else:
+            output = item.copy()
+        
+        # Apply type conversions in place
+        for field, target_type, converter in conversions:
+            value = output.get(field)
+            if value is not None:
+                try:
+                    output[field] = converter(value)
+                except Exception as e:
+                    self.logger.warning(
+                        f"Type conversion failed for field '{field}': "
+                        f"Failed to convert {value} to {target_type}: {str(e)}"
+                    )
+        
+        # Apply custom functions; every function sees the item before any of
+        # their results are added, so results are written afterwards. The item
+        # is bound into the evaluator globals once for all of them.
+        if functions:
+            results = []
+            safe_globals = SafeEvaluator._get_globals()
+            safe_globals['item'] = output
+            try:
+                for field_name, func, error in functions:
+                    if func is None:
+                        self.logger.warning(f"Custom function '{field_name}' failed: {error}")
+                        results.append((field_name, None))
+                        continue
+                    try:
+                        results.append((field_name, func()))
+                    except Exception as e:
+                        self.logger.warning(
+                            f"Custom function '{field_name}' failed: Failed to evaluate lambda: {str(e)}"
+                        )
+                        results.append((field_name, None))
+            finally:
+                safe_globals.pop('item', None)
+            output.update(results)
+        
+        return output
     
     def _apply_field_mapping(self, item: Dict[str, Any], field_mapping: Dict[str, str]) -> Dict[str, Any]:
         """Apply field mapping to rename fields."""
         if not field_mapping:
             return item.copy()
         
+        # Two plain passes rather than a single {mapping.get(k, k): v} pass:
+        # that form puts fields in item order instead of mapped-fields-first
+        # (the column order storage writes), lets a mapped value win over an
+        # unmapped field of the same name, and with a per-item collision
+        # check to prevent that it measured slower
         mapped_item = {}
         
         # Map existing fields to new names
@@ -220,75 +802,46 @@ class DataTransformer:
         
         converted_item = item.copy()
         
-        for field, target_type in type_conversions.items():
-            if field in converted_item and converted_item[field] is not None:
+        for field, target_type, converter in self._resolve_type_conversions(type_conversions):
+            value = converted_item.get(field)
+            if value is not None:
                 try:
-                    converted_item[field] = self._convert_type(
-                        converted_item[field], target_type
-                    )
+                    converted_item[field] = converter(value)
                 except Exception as e:
-                    self.logger.warning(f"Type conversion failed for field '{field}': {str(e)}")
+                    self.logger.warning(
+                        f"Type conversion failed for field '{field}': "
+                        f"Failed to convert {value} to {target_type}: {str(e)}"
+                    )
         
         return converted_item
     
+    def _resolve_type_conversions(self, type_conversions: Dict[str, str]) -> List[Tuple[str, str, Callable[[Any], Any]]]:
+        """
+        Resolve target type names to converter callables once per mapping.
+        
+        The result is reused while the same, unchanged mapping is passed in;
+        fields with unknown target types are left out (values stay as-is).
+        """
+        if self._resolved_conversions[0] is not type_conversions or self._resolved_conversions[1] != type_conversions:
+            resolved = [
+                (field, target_type, _CONVERTERS[target_type.lower()])
+                for field, target_type in type_conversions.items()
+                if target_type.lower() in _CONVERTERS
+            ]
+            self._resolved_conversions = (type_conversions, dict(type_conversions), resolved)
+        return self._resolved_conversions[2]
+    
     def _convert_type(self, value: Any, target_type: str) -> Any:
         """Convert value to target type."""
         if value is None:
             return None
         
+        converter = _CONVERTERS.get(target_type.lower())
+        if converter is None:
+            return value
+        
         try:
-            if target_type.lower() == "string":
-                return str(value)
-            elif target_type.lower() == "int":
-                return int(float(value)) if isinstance(value, str) else int(value)
-            elif target_type.lower() == "float":
-                return float(value)
-            elif target_type.lower() == "bool":
-                if isinstance(value, str):
-                    return value.lower() in ('true', '1', 'yes', 'on')
-                return bool(value)
-            elif target_type.lower() == "array":
-                if isinstance(value, str):
-                    # Try to parse as JSON array
-                    try:
-                        parsed = json.loads(value)
-                        if isinstance(parsed, list):
-                            return parsed
-                    except:
-                        pass
-                    # Split by comma if not JSON
-                    return [item.strip() for item in value.split(',')]
-                elif isinstance(value, (list, tuple)):
-                    return list(value)
-                else:
-                    return [value]
-            elif target_type.lower() == "dict":
-                if isinstance(value, str):
-                    return json.loads(value)
-                elif isinstance(value, dict):
-                    return value
-                else:
-                    return {"value": value}
-            elif target_type.lower() == "datetime":
-                if isinstance(value, str):
-                    # Try common datetime formats
-                    formats = [
-                        '%Y-%m-%d %H:%M:%S',
-                        '%Y-%m-%dT%H:%M:%S',
-                        '%Y-%m-%d',
-                        '%m/%d/%Y',
-                        '%d/%m/%Y'
-                    ]
-                    for fmt in formats:
-                        try:
-                            return datetime.strptime(value, fmt)
-                        except ValueError:
-                            continue
-                    # If no format matches, return original string
-                    return value
-                return value
-            else:
-                return value
+            return converter(value)
         except Exception as e:
             raise TransformationError(f"Failed to convert {value} to {target_type}: {str(e)}")
     
@@ -301,7 +854,8 @@ class DataTransformer:
         
         for field_name, func_str in custom_functions.items():
             try:
-                result = SafeEvaluator.evaluate_lambda(func_str, item)
+                code = self._get_compiled_function(func_str)
+                result = SafeEvaluator.evaluate_compiled(code, item)
                 transformed_item[field_name] = result
             except Exception as e:
                 self.logger.warning(f"Custom function '{field_name}' failed: {str(e)}")
@@ -321,14 +875,9 @@ class DataTransformer:
     def get_transformation_stats(self, original_items: List[Dict[str, Any]], 
                                 transformed_items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Get transformation statistics."""
-        original_fields = set()
-        transformed_fields = set()
-        
-        for item in original_items:
-            original_fields.update(item.keys())
-        
-        for item in transformed_items:
-            transformed_fields.update(item.keys())
+        # One C-level union per list (iterating a dict yields its keys)
+        original_fields = set().union(*original_items)
+        transformed_fields = set().union(*transformed_items)
         
         return {
             "original_count": len(original_items),
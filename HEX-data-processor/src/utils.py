@@ -6,12 +6,77 @@ Provides helper functions for parsing, date handling, and common operations.
 
 import re
 import json
+import math
 import hashlib
 from typing import Dict, Any, Optional, Union, List
 from datetime import datetime, date
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
 
+try:
+    import blake3
+except ImportError:  # Optional fast fingerprint hash
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:  # Optional fast fingerprint hash
+    xxhash = None
+
+# Patterns compiled once at import for the text helpers below
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_FILENAME_CONTROL_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE)
+_PHONE_RE = re.compile(
+    r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'  # US format
+    r'|\+?[0-9]{1,3}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{4}'  # International
+)
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+# clean_text: curly quotes to ASCII, control characters (except \n and \t) removed
+_CLEAN_TEXT_TABLE = str.maketrans({
+    '\u201c': '"',
+    '\u201d': '"',
+    '\u2018': "'",
+    '\u2019': "'",
+    **{chr(i): None for i in range(32) if chr(i) not in '\n\t'},
+    **{chr(i): None for i in range(0x7f, 0xa0)},
+})
+_ISO_DATETIME_RE = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})(?:([ T])([0-9]{2}):([0-9]{2}):([0-9]{2})(Z?))?'
+)
+
+# Default parse_date formats, tried after the parse_iso_datetime fast path
+_DATE_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%m-%d-%Y',
+    '%d-%m-%Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%d %B %Y',
+    '%d %b %Y'
+)
+
+# md5 stays the default so existing digests keep matching; blake3 and xxh3 are
+# much faster for non-cryptographic fingerprints when their packages are installed
+_HASH_ALGORITHMS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+}
+if blake3 is not None:
+    _HASH_ALGORITHMS["blake3"] = blake3.blake3
+if xxhash is not None:
+    _HASH_ALGORITHMS["xxh3"] = xxhash.xxh3_128
+_OPTIONAL_HASH_PACKAGES = {"blake3": "blake3", "xxh3": "xxhash"}
+
 
 def clean_text(text: str) -> str:
     """
@@ -26,17 +91,9 @@ def clean_text(text: str) -> str:
     if not isinstance(text, str):
         text = str(text) if text is not None else ""
     
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Remove control characters except newlines and tabs
-    text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\t')
-    
-    # Normalize quotes
-    text = text.replace('"', '"').replace('"', '"')
-    text = text.replace(''', "'").replace(''', "'")
-    
-    return text
+    # Remove excessive whitespace, then remove control characters and
+    # normalize quotes in a single translate pass
+    return _WHITESPACE_RE.sub(' ', text.strip()).translate(_CLEAN_TEXT_TABLE)
 
 
 def extract_domain(url: str) -> Optional[str]:
@@ -81,30 +138,70 @@ def normalize_url(url: str, base_url: Optional[str] = None) -> str:
     return url
 
 
-def generate_hash(content: Union[str, Dict[str, Any]], algorithm: str = "md5") -> str:
+def generate_hash(content: Union[str, bytes, Dict[str, Any]], algorithm: str = "md5") -> str:
     """
     Generate hash for content.
     
+    Bytes-like content is hashed as-is; dicts are hashed over
+    json.dumps(sort_keys=True, ensure_ascii=False), the canonical form
+    existing digests were computed from, so keep it byte-identical.
+    
     Args:
         content: Content to hash
-        algorithm: Hash algorithm ('md5', 'sha1', 'sha256')
+        algorithm: Hash algorithm ('md5', 'sha1', 'sha256', or 'blake3' /
+            'xxh3' when the blake3 / xxhash packages are installed)
         
     Returns:
         Hexadecimal hash string
     """
-    if isinstance(content, dict):
-        content = json.dumps(content, sort_keys=True, ensure_ascii=False)
-    elif not isinstance(content, str):
-        content = str(content)
-    
-    if algorithm == "md5":
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
-    elif algorithm == "sha1":
-        return hashlib.sha1(content.encode('utf-8')).hexdigest()
-    elif algorithm == "sha256":
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
-    else:
+    hash_factory = _HASH_ALGORITHMS.get(algorithm)
+    if hash_factory is None:
+        if algorithm in _OPTIONAL_HASH_PACKAGES:
+            raise ValueError(
+                f"Hash algorithm '{algorithm}' requires the "
+                f"{_OPTIONAL_HASH_PACKAGES[algorithm]} package"
+            )
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        data = content
+    elif isinstance(content, dict):
+        data = json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    else:
+        data = str(content).encode('utf-8')
+    
+    return hash_factory(data).hexdigest()
+
+
+def parse_iso_datetime(date_str: str, allow_utc_suffix: bool = True) -> Optional[datetime]:
+    """
+    Parse the fixed-width ISO forms without going through strptime.
+    
+    Accepts exactly 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM:SS', 'YYYY-MM-DDTHH:MM:SS'
+    and, if allow_utc_suffix, 'YYYY-MM-DDTHH:MM:SSZ' (returned naive, as
+    strptime's '%Y-%m-%dT%H:%M:%SZ' does).
+    
+    Args:
+        date_str: Date string to parse
+        allow_utc_suffix: Whether to accept a trailing 'Z' after a 'T' time
+        
+    Returns:
+        Parsed datetime or None if the string is not one of these forms
+    """
+    match = _ISO_DATETIME_RE.fullmatch(date_str)
+    if match is None:
+        return None
+    
+    year, month, day, separator, hour, minute, second, utc = match.groups()
+    if utc and (separator != 'T' or not allow_utc_suffix):
+        return None
+    
+    try:
+        if separator is None:
+            return datetime(int(year), int(month), int(day))
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+    except ValueError:
+        return None
 
 
 def parse_date(date_str: str, formats: Optional[List[str]] = None) -> Optional[datetime]:
@@ -121,26 +218,18 @@ def parse_date(date_str: str, formats: Optional[List[str]] = None) -> Optional[d
     if not date_str or not isinstance(date_str, str):
         return None
     
-    # Default formats to try
+    date_str = date_str.strip()
+    
+    # Default formats to try, with the common ISO forms parsed directly
     if formats is None:
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-            '%d/%m/%Y',
-            '%m-%d-%Y',
-            '%d-%m-%Y',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y'
-        ]
+        parsed = parse_iso_datetime(date_str)
+        if parsed is not None:
+            return parsed
+        formats = _DATE_FORMATS
     
     for fmt in formats:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
     
@@ -181,10 +270,10 @@ def safe_filename(filename: str) -> str:
         Safe filename string
     """
     # Remove or replace unsafe characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = _UNSAFE_FILENAME_RE.sub('_', filename)
     
     # Remove control characters
-    filename = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', filename)
+    filename = _FILENAME_CONTROL_RE.sub('', filename)
     
     # Limit length
     if len(filename) > 255:
@@ -208,8 +297,7 @@ def extract_emails(text: str) -> List[str]:
     Returns:
         List of email addresses found
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_pattern, text, re.IGNORECASE)
+    return _EMAIL_RE.findall(text)
 
 
 def extract_phone_numbers(text: str) -> List[str]:
@@ -220,19 +308,11 @@ def extract_phone_numbers(text: str) -> List[str]:
         text: Text to extract phone numbers from
         
     Returns:
-        List of phone numbers found
+        List of phone numbers found, in order of appearance
     """
-    # Simple phone number patterns
-    patterns = [
-        r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',  # US format
-        r'\+?[0-9]{1,3}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{4}',  # International
-    ]
-    
-    phones = []
-    for pattern in patterns:
-        phones.extend(re.findall(pattern, text))
-    
-    return phones
+    # US and international formats in a single pass over the text; matches
+    # never overlap, so a number fitting both formats is reported once
+    return _PHONE_RE.findall(text)
 
 
 def slugify(text: str) -> str:
@@ -249,8 +329,8 @@ def slugify(text: str) -> str:
     slug = text.lower().strip()
     
     # Replace spaces and special characters with hyphens
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
+    slug = _SLUG_STRIP_RE.sub('', slug)
+    slug = _SLUG_DASH_RE.sub('-', slug)
     
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -270,15 +350,26 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
     """
     result = {}
     
+    # ids of nested dicts created here, which can be merged into in place;
+    # nested dicts still shared with an input are copied first
+    owned = set()
+    
     for d in dicts:
         if not isinstance(d, dict):
             continue
         
-        for key, value in d.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = merge_dicts(result[key], value)
-            else:
-                result[key] = value
+        stack = [(result, d)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    if id(current) not in owned:
+                        current = target[key] = dict(current)
+                        owned.add(id(current))
+                    stack.append((current, value))
+                else:
+                    target[key] = value
     
     return result
 
@@ -311,29 +402,86 @@ def flatten_dict(d: Dict[str, Any], separator: str = '.') -> Dict[str, Any]:
     Returns:
         Flattened dictionary
     """
-    def _flatten(obj, parent_key=''):
-        items = []
-        
-        if isinstance(obj, dict):
-            for key, value in obj.items():
+    if not isinstance(d, (dict, list)):
+        return {'': d}
+    
+    flat = {}
+    
+    # Depth-first walk with an explicit stack of (key prefix, child iterator,
+    # is list); leaves are written straight into flat in document order
+    stack = [('', iter(d.items()) if isinstance(d, dict) else enumerate(d), isinstance(d, list))]
+    while stack:
+        parent_key, children, is_list = stack[-1]
+        for key, value in children:
+            if is_list:
+                new_key = f"{parent_key}{separator}{key}" if parent_key else str(key)
+            else:
                 new_key = f"{parent_key}{separator}{key}" if parent_key else key
-                if isinstance(value, (dict, list)):
-                    items.extend(_flatten(value, new_key).items())
-                else:
-                    items.append((new_key, value))
-        elif isinstance(obj, list):
-            for i, value in enumerate(obj):
-                new_key = f"{parent_key}{separator}{i}" if parent_key else str(i)
-                if isinstance(value, (dict, list)):
-                    items.extend(_flatten(value, new_key).items())
-                else:
-                    items.append((new_key, value))
+            
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items()), False))
+                break
+            if isinstance(value, list):
+                stack.append((new_key, enumerate(value), True))
+                break
+            flat[new_key] = value
         else:
-            items.append((parent_key, obj))
-        
-        return dict(items)
+            stack.pop()
+    
+    return flat
+
+
+class BloomFilter:
+    """
+    Space-efficient probabilistic set of strings.
+    
+    Membership tests never give false negatives; false positives occur at
+    roughly error_rate once capacity items have been added.
+    """
     
-    return _flatten(d)
+    def __init__(self, capacity: int, error_rate: float = 1e-6):
+        """
+        Initialize Bloom filter.
+        
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate at capacity
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+    
+    def _positions(self, item: str):
+        """Yield bit positions for item using double hashing."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+    
+    def add(self, item: str) -> None:
+        """Add item to the filter."""
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+    
+    def __len__(self) -> int:
+        """Number of items added."""
+        return self._count
 
 
 if __name__ == "__main__":
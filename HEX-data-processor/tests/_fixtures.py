@@ -0,0 +1,225 @@
+"""
+Shared test fixtures.
+
+Imported only by the top-level ``tests/conftest.py``. Nested conftest files
+must not import this module again: pytest would register the session
+fixtures a second time and build them once per importing conftest.
+"""
+
+import pytest
+import copy
+import orjson
+from unittest.mock import MagicMock
+
+from bs4 import BeautifulSoup
+
+from src.config import Config, TargetConfig, StorageConfig
+from src.http_client import HTTPClient
+
+__all__ = [
+    "temp_config_file",
+    "sample_config",
+    "sample_items",
+    "temp_dir",
+    "mock_html_content",
+    "parsed_mock_html",
+    "http_client_spec",
+]
+
+
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
+    """Create a temporary configuration file (shared by the session, do not modify)."""
+    config_data = {
+        "project": {
+            "name": "Test Project",
+            "version": "1.0.0",
+            "description": "Test configuration"
+        },
+        "scraper": {
+            "user_agent": "TestBot/1.0",
+            "timeout": 30,
+            "max_retries": 3,
+            "rate_limit": 1.0,
+            "max_concurrent": 5
+        },
+        "targets": {
+            "test_target": {
+                "name": "Test Target",
+                "base_url": "https://example.com",
+                "start_urls": ["https://example.com"],
+                "selectors": {
+                    "item": "div.item",
+                    "title": "h2.title::text",
+                    "content": "div.content::text"
+                },
+                "pagination": {
+                    "enabled": False,
+                    "next_selector": None,
+                    "max_pages": 10
+                },
+                "js_render": False,
+                "rate_limit": 1.0
+            }
+        },
+        "cleaner": {
+            "remove_duplicates": True,
+            "duplicate_keys": ["title"],
+            "handle_missing": {
+                "strategy": "default",
+                "default_values": {
+                    "title": "Untitled",
+                    "content": "No content"
+                }
+            }
+        },
+        "transformer": {
+            "field_mapping": {
+                "title": "item_title",
+                "content": "item_content"
+            },
+            "type_conversions": {
+                "item_title": "string",
+                "item_content": "string"
+            },
+            "custom_functions": {
+                "title_length": "lambda item: len(item.get('item_title', ''))"
+            }
+        },
+        "storage": {
+            "type": "csv",
+            "path": "./test_data",
+            "filename_template": "test_{timestamp}.csv"
+        },
+        "notifications": {
+            "enabled": False
+        },
+        "scheduler": {
+            "enabled": False
+        },
+        "metrics": {
+            "enabled": True,
+            "port": 8001
+        },
+        "logging": {
+            "level": "INFO",
+            "format": "text",
+            "console": True
+        }
+    }
+    
+    # pytest removes the directory itself
+    path = tmp_path_factory.mktemp("cfg") / "config.json"
+    path.write_bytes(orjson.dumps(config_data))
+    
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def sample_config():
+    """Create a sample configuration object (shared by the session, do not modify)."""
+    return Config(
+        project={
+            "name": "Test Project",
+            "version": "1.0.0"
+        },
+        scraper={
+            "user_agent": "TestBot/1.0",
+            "timeout": 30,
+            "max_retries": 3,
+            "rate_limit": 1.0
+        },
+        targets={
+            "test": TargetConfig(
+                name="Test Target",
+                base_url="https://example.com",
+                start_urls=["https://example.com"],
+                selectors={"title": "h1::text"}
+            )
+        },
+        storage=StorageConfig(type="csv", path="./test_data")
+    )
+
+
+# Deep-copied by sample_items so tests can modify their items
+_SAMPLE_ITEMS_TEMPLATE = [
+    {
+        "title": "First Item",
+        "content": "This is the first item content.",
+        "author": "John Doe",
+        "tags": ["test", "sample"],
+        "url": "https://example.com/1",
+        "date": "2024-01-15"
+    },
+    {
+        "title": "Second Item",
+        "content": "This is the second item content.",
+        "author": "Jane Smith",
+        "tags": ["example", "demo"],
+        "url": "https://example.com/2",
+        "date": "2024-01-16"
+    },
+    {
+        "title": "First Item",  # Duplicate
+        "content": "This is the first item content.",
+        "author": "John Doe",
+        "tags": ["test", "sample"],
+        "url": "https://example.com/1",
+        "date": "2024-01-15"
+    }
+]
+
+
+@pytest.fixture(scope="session")
+def http_client_spec():
+    """HTTPClient-spec'd mock built once; reset it before use in each test."""
+    return MagicMock(spec=HTTPClient)
+
+
+@pytest.fixture
+def sample_items():
+    """Create sample data items for testing (a fresh copy, safe to modify)."""
+    return copy.deepcopy(_SAMPLE_ITEMS_TEMPLATE)
+
+
+@pytest.fixture
+def temp_dir(tmp_path_factory):
+    """Create a temporary directory (cleaned up by pytest's tmp_path retention)."""
+    return tmp_path_factory.mktemp("scratch")
+
+
+# Returned as-is by mock_html_content (and parsed once by parsed_mock_html)
+_MOCK_HTML = """
+    <html>
+        <head><title>Test Page</title></head>
+        <body>
+            <div class="container">
+                <div class="item">
+                    <h2 class="title">First Title</h2>
+                    <div class="content">First content</div>
+                    <span class="author">Author 1</span>
+                </div>
+                <div class="item">
+                    <h2 class="title">Second Title</h2>
+                    <div class="content">Second content</div>
+                    <span class="author">Author 2</span>
+                </div>
+                <nav class="pagination">
+                    <a class="next" href="/page/2">Next</a>
+                </nav>
+            </div>
+        </body>
+    </html>
+    """
+
+
+@pytest.fixture(scope="session")
+def mock_html_content():
+    """Sample HTML content for scraping tests."""
+    return _MOCK_HTML
+
+
+@pytest.fixture(scope="session")
+def parsed_mock_html(mock_html_content):
+    """mock_html_content parsed once with lxml (shared by the session, do not modify)."""
+    return BeautifulSoup(mock_html_content, "lxml")
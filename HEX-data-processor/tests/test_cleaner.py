@@ -6,6 +6,17 @@ import pytest
 from src.cleaner import DataCleaner, CleanerConfig, FieldValidation
 
 
+# Field rules are read-only once validated, so configs can share them
+_REQUIRED_STRING = FieldValidation(required=True, type="string")
+_OPTIONAL_INT = FieldValidation(required=False, type="int")
+
+
+@pytest.fixture(scope="module")
+def default_cleaner():
+    """Default-config cleaner shared by the module (it keeps no per-call state)."""
+    return DataCleaner()
+
+
 class TestDataCleaner:
     """Test data cleaner functionality."""
     
@@ -20,9 +31,9 @@ class TestDataCleaner:
             {"text": "Another quote", "author": "Bob", "tags": ["inspiration"], "age": "40"},
         ]
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def basic_cleaner_config(self):
-        """Create basic cleaner configuration."""
+        """Create basic cleaner configuration (shared, treat as read-only)."""
         return CleanerConfig(
             remove_duplicates=True,
             duplicate_keys=["text", "author"],
@@ -53,20 +64,16 @@ class TestDataCleaner:
         item_with_spaces = next(item for item in cleaned if item["age"] == 25)
         assert item_with_spaces["text"] == "Hello World"
     
-    def test_clean_string(self):
+    def test_clean_string(self, default_cleaner):
         """Test string cleaning functionality."""
-        cleaner = DataCleaner()
-        
-        assert cleaner._clean_string("  Hello   World  ") == "Hello World"
-        assert cleaner._clean_string("\n\tTest\n") == "Test"
-        assert cleaner._clean_string("Multiple   spaces") == "Multiple spaces"
-        assert cleaner._clean_string(None) == ""
-        assert cleaner._clean_string(123) == "123"
+        assert default_cleaner._clean_string("  Hello   World  ") == "Hello World"
+        assert default_cleaner._clean_string("\n\tTest\n") == "Test"
+        assert default_cleaner._clean_string("Multiple   spaces") == "Multiple spaces"
+        assert default_cleaner._clean_string(None) == ""
+        assert default_cleaner._clean_string(123) == "123"
     
-    def test_remove_duplicates(self):
+    def test_remove_duplicates(self, default_cleaner):
         """Test duplicate removal."""
-        cleaner = DataCleaner()
-        
         items = [
             {"id": 1, "name": "John"},
             {"id": 2, "name": "Jane"},
@@ -74,7 +81,7 @@ class TestDataCleaner:
             {"id": 3, "name": "Bob"},
         ]
         
-        unique = cleaner._remove_duplicates(items, ["id", "name"])
+        unique = default_cleaner._remove_duplicates(items, ["id", "name"])
         assert len(unique) == 3
         
         names = [item["name"] for item in unique]
@@ -90,8 +97,8 @@ class TestDataCleaner:
                 "default_values": {}
             },
             field_validation={
-                "text": FieldValidation(required=True, type="string"),
-                "author": FieldValidation(required=True, type="string")
+                "text": _REQUIRED_STRING,
+                "author": _REQUIRED_STRING
             }
         )
         
@@ -125,10 +132,8 @@ class TestDataCleaner:
             assert item["author"] is not None
             assert item["tags"] is not None
     
-    def test_type_conversions(self):
+    def test_type_conversions(self, default_cleaner):
         """Test type conversion handling."""
-        cleaner = DataCleaner()
-        
         # Test cleaning of different types
         test_item = {
             "text": "Test quote",
@@ -138,7 +143,7 @@ class TestDataCleaner:
             "none_value": None
         }
         
-        cleaned = cleaner._clean_item(test_item)
+        cleaned = default_cleaner._clean_item(test_item)
         
         assert cleaned["text"] == "Test quote"
         assert cleaned["tags"] == ["tag1", "tag2"]
@@ -146,12 +151,11 @@ class TestDataCleaner:
         assert cleaned["number"] == 42
         assert cleaned["none_value"] is None
     
-    def test_get_cleaning_stats(self, sample_items):
+    def test_get_cleaning_stats(self, default_cleaner, sample_items):
         """Test cleaning statistics."""
-        cleaner = DataCleaner()
-        cleaned = cleaner.clean_data(sample_items)
+        cleaned = default_cleaner.clean_data(sample_items)
         
-        stats = cleaner.get_cleaning_stats(sample_items, cleaned)
+        stats = default_cleaner.get_cleaning_stats(sample_items, cleaned)
         
         assert "original_count" in stats
         assert "cleaned_count" in stats
@@ -161,18 +165,17 @@ class TestDataCleaner:
         assert stats["original_count"] == len(sample_items)
         assert stats["cleaned_count"] == len(cleaned)
     
-    def test_clean_empty_list(self):
+    def test_clean_empty_list(self, default_cleaner):
         """Test cleaning empty list."""
-        cleaner = DataCleaner()
-        cleaned = cleaner.clean_data([])
+        cleaned = default_cleaner.clean_data([])
         assert cleaned == []
     
     def test_clean_with_field_validation(self):
         """Test cleaning with field validation."""
         config = CleanerConfig(
             field_validation={
-                "text": FieldValidation(required=True, type="string"),
-                "age": FieldValidation(required=False, type="int")
+                "text": _REQUIRED_STRING,
+                "age": _OPTIONAL_INT
             }
         )
         
@@ -206,10 +209,8 @@ class TestDataCleaner:
         # Should fall back to default strategy for now
         assert len(cleaned) > 0
     
-    def test_clean_item_complex(self):
+    def test_clean_item_complex(self, default_cleaner):
         """Test cleaning complex item."""
-        cleaner = DataCleaner()
-        
         complex_item = {
             "text": "  Complex\n\ttext  ",
             "metadata": {
@@ -222,7 +223,7 @@ class TestDataCleaner:
             "none_value": None
         }
         
-        cleaned = cleaner._clean_item(complex_item)
+        cleaned = default_cleaner._clean_item(complex_item)
         
         assert cleaned["text"] == "Complex text"
         assert cleaned["metadata"]["source"] == "test"
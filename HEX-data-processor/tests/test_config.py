@@ -3,61 +3,65 @@ Tests for configuration module.
 """
 
 import pytest
-import json
-import tempfile
-import os
+import orjson
 from pathlib import Path
 
 from src.config import Config, load_config, ProjectConfig, ScraperConfig, StorageConfig
 
 
+# Shared by the tests that only read a valid config
+_MINIMAL_CONFIG = {
+    "project": {
+        "name": "Test Project",
+        "version": "1.0.0"
+    },
+    "scraper": {
+        "user_agent": "Test Agent",
+        "timeout": 30,
+        "max_retries": 3,
+        "rate_limit": 1.0
+    },
+    "targets": {
+        "test": {
+            "name": "Test Target",
+            "base_url": "https://example.com",
+            "start_urls": ["https://example.com"],
+            "selectors": {"title": "h1"}
+        }
+    },
+    "storage": {
+        "type": "csv",
+        "path": "./data"
+    }
+}
+
+
+# Tests that depend on environment variables or invalid input write and load
+# their own files; caching those loads would hide the behaviour under test.
+@pytest.fixture(scope="module")
+def loaded_config(tmp_path_factory):
+    """Write the minimal config once and load it (shared by the module, do not modify)."""
+    config_path = tmp_path_factory.mktemp("cfg") / "config.json"
+    config_path.write_bytes(orjson.dumps(_MINIMAL_CONFIG))
+    
+    return Config.load_from_file(str(config_path))
+
+
 class TestConfig:
     """Test configuration loading and validation."""
     
-    def test_minimal_config(self):
+    def test_minimal_config(self, loaded_config):
         """Test loading minimal valid configuration."""
-        minimal_config = {
-            "project": {
-                "name": "Test Project",
-                "version": "1.0.0"
-            },
-            "scraper": {
-                "user_agent": "Test Agent",
-                "timeout": 30,
-                "max_retries": 3,
-                "rate_limit": 1.0
-            },
-            "targets": {
-                "test": {
-                    "name": "Test Target",
-                    "base_url": "https://example.com",
-                    "start_urls": ["https://example.com"],
-                    "selectors": {"title": "h1"}
-                }
-            },
-            "storage": {
-                "type": "csv",
-                "path": "./data"
-            }
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(minimal_config, f)
-            temp_path = f.name
-        
-        try:
-            config = Config.load_from_file(temp_path)
-            assert config.project.name == "Test Project"
-            assert config.project.version == "1.0.0"
-            assert config.scraper.user_agent == "Test Agent"
-            assert config.storage.type == "csv"
-            assert "test" in config.targets
-        finally:
-            os.unlink(temp_path)
+        config = loaded_config
+        assert config.project.name == "Test Project"
+        assert config.project.version == "1.0.0"
+        assert config.scraper.user_agent == "Test Agent"
+        assert config.storage.type == "csv"
+        assert "test" in config.targets
     
-    def test_env_var_substitution(self):
+    def test_env_var_substitution(self, tmp_path, monkeypatch):
         """Test environment variable substitution."""
-        os.environ['TEST_TOKEN'] = 'secret123'
+        monkeypatch.setenv('TEST_TOKEN', 'secret123')
         
         config_with_env = {
             "project": {
@@ -90,18 +94,13 @@ class TestConfig:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_with_env, f)
-            temp_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(orjson.dumps(config_with_env))
         
-        try:
-            config = Config.load_from_file(temp_path)
-            assert config.notifications.telegram.bot_token == "secret123"
-        finally:
-            os.unlink(temp_path)
-            del os.environ['TEST_TOKEN']
+        config = Config.load_from_file(str(config_path))
+        assert config.notifications.telegram.bot_token == "secret123"
     
-    def test_invalid_config(self):
+    def test_invalid_config(self, tmp_path):
         """Test loading invalid configuration."""
         invalid_config = {
             "project": {
@@ -111,72 +110,40 @@ class TestConfig:
             # Missing required sections
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(orjson.dumps(invalid_config))
         
-        try:
-            with pytest.raises(Exception):  # Should raise validation error
-                Config.load_from_file(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(Exception):  # Should raise validation error
+            Config.load_from_file(str(config_path))
     
-    def test_get_target(self):
+    def test_get_target(self, tmp_path):
         """Test getting target configuration."""
-        config = {
-            "project": {"name": "Test", "version": "1.0.0"},
-            "scraper": {"user_agent": "Test", "timeout": 30, "max_retries": 3, "rate_limit": 1.0},
-            "targets": {
-                "target1": {
-                    "name": "Target 1",
-                    "base_url": "https://example1.com",
-                    "start_urls": ["https://example1.com"],
-                    "selectors": {"title": "h1"}
-                }
-            },
-            "storage": {"type": "csv", "path": "./data"}
-        }
+        config = dict(_MINIMAL_CONFIG, targets={
+            f"target{n}": {
+                "name": f"Target {n}",
+                "base_url": f"https://example{n}.com",
+                "start_urls": [f"https://example{n}.com"],
+                "selectors": {"title": "h1"}
+            }
+            for n in (1, 2, 3)
+        })
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config, f)
-            temp_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(orjson.dumps(config))
+        config_obj = Config.load_from_file(str(config_path))
         
-        try:
-            config_obj = Config.load_from_file(temp_path)
-            target = config_obj.get_target("target1")
-            assert target.name == "Target 1"
-            
-            with pytest.raises(ValueError):
-                config_obj.get_target("nonexistent")
-        finally:
-            os.unlink(temp_path)
+        for n in (1, 2, 3):
+            target = config_obj.get_target(f"target{n}")
+            assert target.name == f"Target {n}"
+            assert str(target.base_url).startswith(f"https://example{n}.com")
+        
+        with pytest.raises(ValueError):
+            config_obj.get_target("nonexistent")
     
-    def test_config_validation(self):
+    def test_config_validation(self, loaded_config):
         """Test configuration validation."""
-        config = {
-            "project": {"name": "Test", "version": "1.0.0"},
-            "scraper": {"user_agent": "Test", "timeout": 30, "max_retries": 3, "rate_limit": 1.0},
-            "targets": {
-                "test": {
-                    "name": "Test",
-                    "base_url": "https://example.com",
-                    "start_urls": ["https://example.com"],
-                    "selectors": {"title": "h1"}
-                }
-            },
-            "storage": {"type": "csv", "path": "./data"}
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config, f)
-            temp_path = f.name
-        
-        try:
-            config_obj = Config.load_from_file(temp_path)
-            assert config_obj.validate() is True
-        finally:
-            os.unlink(temp_path)
+        assert loaded_config.validate() is True
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
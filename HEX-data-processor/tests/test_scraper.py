@@ -6,24 +6,68 @@ import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
-from src.scraper import Scraper, JSError
+from bs4 import BeautifulSoup
+
+from src.scraper import Scraper, JSError, _SeenURLs
 from src.config import TargetConfig, PaginationConfig
-from src.http_client import HTTPClient
+
+
+# Mock pages parsed once at import; the scraper uses a parsed document as-is
+_STATIC_PAGE = BeautifulSoup("""
+    <html>
+        <body>
+            <div class="quote">
+                <span class="text">Test quote 1</span>
+                <small class="author">Author 1</small>
+            </div>
+            <div class="quote">
+                <span class="text">Test quote 2</span>
+                <small class="author">Author 2</small>
+            </div>
+        </body>
+    </html>
+    """, "lxml")
+
+_FIRST_PAGE = BeautifulSoup("""
+    <html>
+        <body>
+            <div class="quote">
+                <span class="text">Quote 1</span>
+                <small class="author">Author 1</small>
+            </div>
+            <li class="next">
+                <a href="/page/2">Next</a>
+            </li>
+        </body>
+    </html>
+    """, "lxml")
+
+_SECOND_PAGE = BeautifulSoup("""
+    <html>
+        <body>
+            <div class="quote">
+                <span class="text">Quote 2</span>
+                <small class="author">Author 2</small>
+            </div>
+        </body>
+    </html>
+    """, "lxml")
 
 
 class TestScraper:
     """Test scraper functionality."""
     
     @pytest.fixture
-    def mock_http_client(self):
-        """Create mock HTTP client."""
-        client = MagicMock(spec=HTTPClient)
+    def mock_http_client(self, http_client_spec):
+        """Create mock HTTP client from the session's spec'd mock."""
+        client = http_client_spec
+        client.reset_mock(return_value=True, side_effect=True)
         client.fetch = AsyncMock()
         return client
     
-    @pytest.fixture
-    def target_config(self):
-        """Create test target configuration."""
+    @pytest.fixture(scope="module")
+    def _base_target_config(self):
+        """Validated target configuration built once; copy it before use."""
         return TargetConfig(
             name="Test Target",
             base_url="https://example.com",
@@ -42,6 +86,11 @@ class TestScraper:
             rate_limit=1.0
         )
     
+    @pytest.fixture
+    def target_config(self, _base_target_config):
+        """Create test target configuration (a deep copy, safe to modify)."""
+        return _base_target_config.model_copy(deep=True)
+    
     @pytest.fixture
     def scraper(self, mock_http_client):
         """Create scraper instance."""
@@ -54,20 +103,7 @@ class TestScraper:
         mock_response = {
             "url": "https://example.com",
             "status_code": 200,
-            "text": """
-            <html>
-                <body>
-                    <div class="quote">
-                        <span class="text">Test quote 1</span>
-                        <small class="author">Author 1</small>
-                    </div>
-                    <div class="quote">
-                        <span class="text">Test quote 2</span>
-                        <small class="author">Author 2</small>
-                    </div>
-                </body>
-            </html>
-            """
+            "text": _STATIC_PAGE
         }
         
         mock_http_client.fetch.return_value = mock_response
@@ -87,60 +123,29 @@ class TestScraper:
         assert items[1]["author"] == "Author 2"
     
     @pytest.mark.asyncio
-    async def test_scrape_with_pagination(self, scraper, mock_http_client):
+    async def test_scrape_with_pagination(self, scraper, target_config, mock_http_client):
         """Test scraping with pagination."""
-        # Configure target with pagination
-        target_config = TargetConfig(
-            name="Test Target",
-            base_url="https://example.com",
-            start_urls=["https://example.com"],
-            selectors={
-                "quote": "div.quote",
-                "text": "span.text::text",
-                "author": "small.author::text"
-            },
-            pagination=PaginationConfig(
+        # Enable pagination on a copy of the base target
+        target_config = target_config.model_copy(update={
+            "pagination": PaginationConfig(
                 enabled=True,
                 next_selector="li.next a::attr(href)",
                 max_pages=2
-            ),
-            js_render=False,
-            rate_limit=1.0
-        )
+            )
+        })
         
         # Mock first page
         first_page_response = {
             "url": "https://example.com",
             "status_code": 200,
-            "text": """
-            <html>
-                <body>
-                    <div class="quote">
-                        <span class="text">Quote 1</span>
-                        <small class="author">Author 1</small>
-                    </div>
-                    <li class="next">
-                        <a href="/page/2">Next</a>
-                    </li>
-                </body>
-            </html>
-            """
+            "text": _FIRST_PAGE
         }
         
         # Mock second page
         second_page_response = {
             "url": "https://example.com/page/2",
             "status_code": 200,
-            "text": """
-            <html>
-                <body>
-                    <div class="quote">
-                        <span class="text">Quote 2</span>
-                        <small class="author">Author 2</small>
-                    </div>
-                </body>
-            </html>
-            """
+            "text": _SECOND_PAGE
         }
         
         mock_http_client.fetch.side_effect = [first_page_response, second_page_response]
@@ -187,30 +192,63 @@ class TestScraper:
         assert len(items) == 0
     
     @pytest.mark.asyncio
-    async def test_get_next_url(self, scraper):
+    async def test_get_next_url(self, scraper, parsed_mock_html):
         """Test getting next URL from pagination."""
-        from bs4 import BeautifulSoup
-        
-        html = """
-        <html>
-            <li class="next">
-                <a href="/page/2">Next Page</a>
-            </li>
-        </html>
-        """
-        soup = BeautifulSoup(html, 'html.parser')
-        
         target_config = TargetConfig(
             name="Test",
             base_url="https://example.com",
             start_urls=["https://example.com"],
             selectors={"quote": "div.quote"},
-            pagination=PaginationConfig(enabled=True, next_selector="li.next a")
+            pagination=PaginationConfig(enabled=True, next_selector="nav.pagination a.next")
         )
         
-        next_url = scraper._get_next_url(soup, target_config, "https://example.com")
+        next_url = scraper._get_next_url(parsed_mock_html, target_config, "https://example.com")
+        assert next_url == "https://example.com/page/2"
+    
+    @pytest.mark.parametrize("parser", ["selectolax", "lxml-xpath"])
+    def test_extract_items_fast_parsers(self, scraper, target_config, parser):
+        """Test extraction with the optional fast parsers."""
+        pytest.importorskip("selectolax" if parser == "selectolax" else "cssselect")
+        
+        target_config.parser = parser
+        target_config.selectors["link"] = "a::attr(href)"
+        html = """
+        <div class="quote"><span class="text">Quote <b>one</b></span><small class="author">Author</small>
+        <a href="/author/1">about</a></div>
+        <li class="next"><a href="/page/2">Next</a></li>
+        """
+        tree = scraper._parse_html(html, target_config)
+        
+        items = scraper._extract_items(tree, target_config, "https://example.com", "test_run")
+        assert len(items) == 1
+        assert items[0]["text"] == "Quoteone"
+        assert items[0]["author"] == "Author"
+        assert items[0]["link"] == "https://example.com/author/1"
+        
+        target_config.pagination = PaginationConfig(enabled=True, next_selector="li.next a")
+        next_url = scraper._get_next_url(tree, target_config, "https://example.com")
         assert next_url == "https://example.com/page/2"
     
+    @pytest.mark.asyncio
+    async def test_duplicate_start_urls_fetched_once(self, scraper, target_config, mock_http_client):
+        """Test that duplicate seed URLs are only fetched once."""
+        target_config.start_urls = [
+            "https://example.com/page",
+            "https://EXAMPLE.com/page#top",
+            "https://example.com/page"
+        ]
+        
+        mock_http_client.fetch.return_value = {
+            "url": "https://example.com/page",
+            "status_code": 200,
+            "text": '<div class="quote"><span class="text">Quote</span></div>'
+        }
+        
+        items = await scraper.scrape_target(target_config, "test_run")
+        
+        assert len(items) == 1
+        assert mock_http_client.fetch.call_count == 1
+
     @pytest.mark.asyncio
     async def test_check_robots_txt(self, scraper, mock_http_client):
         """Test robots.txt checking."""
@@ -226,19 +264,19 @@ class TestScraper:
         
         assert result["accessible"] is True
         assert "User-agent: *" in result["content"]
+        
+        # Second check for the same host is served from cache
+        await scraper.check_robots_txt("https://example.com/other")
+        assert mock_http_client.fetch.call_count == 1
     
     @pytest.mark.asyncio
-    async def test_extract_item_data_error_handling(self, scraper, target_config):
+    async def test_extract_item_data_error_handling(self, scraper, target_config, parsed_mock_html):
         """Test error handling in item extraction."""
-        from bs4 import BeautifulSoup
-        
-        # Create malformed element
-        html = '<div class="quote"><span class="text">Valid</span></div>'
-        soup = BeautifulSoup(html, 'html.parser')
-        element = soup.find('div')
+        # Element without any of the target's field selectors
+        element = parsed_mock_html.select_one('div.item')
         
         # This should work
-        item = await scraper._extract_item_data(element, target_config, "test_url", "test_run")
+        item = scraper._extract_item_data(element, target_config, "test_url", "test_run")
         assert item is not None
     
     def test_js_renderer_check(self):
@@ -247,6 +285,20 @@ class TestScraper:
         
         # Should return boolean
         assert isinstance(scraper._js_renderer_available, bool)
+    
+    def test_seen_urls_exact_before_bloom(self):
+        """Test that recent URLs are tracked exactly and older ones by the Bloom filter."""
+        seen = _SeenURLs(bloom_capacity=1, recent_size=3)
+        
+        # An overfull one-URL filter matches almost anything; the exact set doesn't
+        for n in range(3):
+            seen.add(f"https://example.com/{n}")
+        assert "https://example.com/0" in seen
+        assert "https://example.com/3" not in seen
+        
+        seen.add("https://example.com/3")
+        assert len(seen) == 4
+        assert "https://example.com/0" in seen
 
 
 if __name__ == "__main__":
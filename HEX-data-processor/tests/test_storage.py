@@ -0,0 +1,185 @@
+"""
+Tests for storage adapters.
+"""
+
+import pytest
+import asyncio
+import json
+import sqlite3
+
+from src.storage.csv_storage import CSVStorageAdapter
+from src.storage.jsonl_storage import JSONLStorageAdapter
+from src.storage.sqlite_storage import SQLiteStorageAdapter
+
+
+class TestJSONLStorage:
+    """Test JSONL storage functionality."""
+    
+    @pytest.mark.asyncio
+    async def test_search_lines_written_by_other_encoders(self, tmp_path):
+        """Test search on lines not written in compact orjson form."""
+        path = tmp_path / "items.jsonl"
+        path.write_text(
+            json.dumps({"name": "a"}) + "\n" + '{"n":"\\u00e9"}\n' + '{"name":"b"}\n',
+            encoding="utf-8"
+        )
+        storage = JSONLStorageAdapter(str(path))
+        
+        assert await storage.search({"name": "a"}) == [{"name": "a"}]
+        assert await storage.search({"n": "é"}) == [{"n": "é"}]
+        assert await storage.search({"name": "c"}) == []
+    
+    @pytest.mark.asyncio
+    async def test_search_own_lines(self, tmp_path):
+        """Test search on lines written by the adapter."""
+        storage = JSONLStorageAdapter(str(tmp_path / "items.jsonl"), mode="w")
+        await storage.save([{"name": "a", "tag": None}, {"name": "b", "tag": "x"}])
+        
+        assert await storage.search({"name": "b"}) == [{"name": "b", "tag": "x"}]
+        assert await storage.search({"tag": None}) == [{"name": "a", "tag": None}]
+        
+        await storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_values_orjson_cannot_encode(self, tmp_path):
+        """Test that wide integers and NaN/Infinity round-trip."""
+        storage = JSONLStorageAdapter(str(tmp_path / "items.jsonl"))
+        assert await storage.save([{"name": "big", "n": 2 ** 70 + 1}, {"name": "nan", "n": float("nan")}])
+        assert await storage.save([{"name": "inf", "n": [float("inf")]}, {"name": "plain", "n": 1}])
+        
+        loaded = {item["name"]: item["n"] for item in await storage.load()}
+        assert loaded["big"] == 2 ** 70 + 1
+        assert loaded["nan"] != loaded["nan"]
+        assert loaded["inf"] == [float("inf")]
+        assert loaded["plain"] == 1
+        
+        await storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_load_lines_with_nan(self, tmp_path):
+        """Test loading NaN/Infinity lines written by the stdlib json module."""
+        path = tmp_path / "items.jsonl"
+        path.write_text(
+            json.dumps({"name": "nan", "n": float("nan")}) + "\n" + '{"name":"inf","n":Infinity}\n',
+            encoding="utf-8"
+        )
+        storage = JSONLStorageAdapter(str(path))
+        
+        loaded = await storage.load()
+        assert [item["name"] for item in loaded] == ["nan", "inf"]
+        assert loaded[1]["n"] == float("inf")
+        assert await storage.count() == 2
+        assert [item["name"] for item in await storage.search({"name": "nan"})] == ["nan"]
+
+
+class TestCSVStorage:
+    """Test CSV storage functionality."""
+    
+    @pytest.mark.asyncio
+    async def test_save_values_orjson_cannot_encode(self, tmp_path):
+        """Test saving non-str dict keys and integers wider than 64 bits."""
+        storage = CSVStorageAdapter(str(tmp_path / "items.csv"), mode="w")
+        
+        assert await storage.save([{"a": {1: 2}}, {"a": [2 ** 70]}])
+        assert [item["a"] for item in await storage.load()] == [{"1": 2}, [2 ** 70]]
+        
+        await storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_save_one_reports_failed_batch(self, tmp_path):
+        """Test that save_one and flush report a failed batched write."""
+        storage = CSVStorageAdapter(str(tmp_path / "items.csv"), mode="w")
+        
+        results = await asyncio.gather(*(storage.save_one({"n": n}) for n in range(3)))
+        assert results == [True, True, True]
+        assert await storage.flush()
+        assert await storage.count() == 3
+        
+        storage.filename = str(tmp_path / "missing" / "items.csv")
+        assert await storage.save_one({"n": 3}) is False
+        assert await storage.flush() is False
+        assert await storage.flush()
+        
+        # Reads wait for queued writes without consuming their failure
+        assert await storage.save_one({"n": 4}) is False
+        await storage.count()
+        assert await storage.flush() is False
+        
+        await storage.close()
+
+
+class TestSQLiteStorage:
+    """Test SQLite storage functionality."""
+    
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        """Create a SQLite adapter on a scratch database."""
+        storage = SQLiteStorageAdapter(database_url=f"sqlite:///{tmp_path / 'items.db'}")
+        yield storage
+        await storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_values_orjson_cannot_encode(self, storage):
+        """Test that wide integers and NaN/Infinity round-trip."""
+        assert await storage.save([{"name": "big", "n": 2 ** 70 + 1}, {"name": "nan", "n": float("nan")}])
+        assert await storage.save([{"name": "inf", "n": [float("inf")]}, {"name": "plain", "n": 1}])
+        
+        loaded = {item["name"]: item["n"] for item in await storage.load()}
+        assert loaded["big"] == 2 ** 70 + 1
+        assert loaded["nan"] != loaded["nan"]
+        assert loaded["inf"] == [float("inf")]
+        
+        # SQLite's JSON functions can't read the NaN/Infinity rows
+        assert await storage.search({"name": "plain"}) == [{"name": "plain", "n": 1}]
+        assert {"name": "plain", "n": 1} in await storage.scan(["name", "n"])
+    
+    @pytest.mark.asyncio
+    async def test_search_index_is_opt_in(self, storage):
+        """Test that search doesn't create indexes and create_search_index does."""
+        await storage.save([{"name": "a"}, {"name": "b"}])
+        list_indexes = f"PRAGMA index_list({storage.table_name})"
+        indexes = {row[1] for row in storage._get_connection().execute(list_indexes)}
+        
+        assert await storage.search({"name": "a"}) == [{"name": "a"}]
+        assert {row[1] for row in storage._get_connection().execute(list_indexes)} == indexes
+        
+        assert await storage.create_search_index("name")
+        assert await storage.create_search_index("bad name") is False
+        assert len({row[1] for row in storage._get_connection().execute(list_indexes)}) == len(indexes) + 1
+        assert await storage.search({"name": "b"}) == [{"name": "b"}]
+    
+    @pytest.mark.asyncio
+    async def test_failed_group_commit_keeps_rows(self, tmp_path):
+        """Test that rows of a failed deferred commit are kept and the failure reported."""
+        storage = SQLiteStorageAdapter(
+            database_url=f"sqlite:///{tmp_path / 'items.db'}",
+            commit_batch_size=10,
+            commit_interval=0.05
+        )
+        drop_table = f"DROP TABLE {storage.table_name}"
+        
+        assert await storage.save([{"n": 1}, {"n": 2}])
+        storage._get_connection().execute(drop_table)
+        with pytest.raises(sqlite3.OperationalError):
+            await storage.flush()
+        
+        # The next save retries the failed commit and reports it
+        assert await storage.save([{"n": 3}]) is False
+        storage._initialize_database()
+        assert await storage.save([{"n": 4}])
+        assert await storage.count() == 4
+        
+        # So does the save after a failed timer commit
+        assert await storage.save([{"n": 5}])
+        storage._get_connection().execute(drop_table)
+        await asyncio.sleep(0.2)
+        assert await storage.save([{"n": 6}]) is False
+        storage._initialize_database()
+        await storage.flush()
+        assert sorted(item["n"] for item in await storage.load()) == [5, 6]
+        
+        await storage.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -3,6 +3,7 @@ Tests for data transformer module.
 """
 
 import pytest
+from datetime import datetime
 from src.transformer import DataTransformer, TransformerConfig, SafeEvaluator, TransformationError
 
 
@@ -175,6 +176,125 @@ class TestDataTransformer:
         with pytest.raises(TransformationError):
             SafeEvaluator.evaluate_lambda("lambda item: __import__('os').system('ls')", item)
     
+    def test_safe_evaluator_expression(self):
+        """Test expression evaluation and its syntax whitelist."""
+        item = {"name": "john", "age": 30}
+        
+        assert SafeEvaluator.evaluate_expression("name.upper()", item) == "JOHN"
+        assert SafeEvaluator.evaluate_expression("item['age'] * 2", item) == 60
+        
+        # Dunder access and lambdas are rejected before evaluation
+        with pytest.raises(TransformationError):
+            SafeEvaluator.evaluate_expression("().__class__", item)
+        with pytest.raises(TransformationError):
+            SafeEvaluator.evaluate_expression("(lambda: 1)()", item)
+    
+    def test_compiled_lambda_reused(self):
+        """Test that a compiled lambda is evaluated against each item."""
+        code = SafeEvaluator.compile_lambda("lambda: item.get('name', '').upper()")
+        
+        assert SafeEvaluator.evaluate_compiled(code, {"name": "john"}) == "JOHN"
+        assert SafeEvaluator.evaluate_compiled(code, {"name": "jane"}) == "JANE"
+        
+        with pytest.raises(TransformationError):
+            SafeEvaluator.compile_lambda("invalid lambda")
+        
+        # Dunder access is rejected before the lambda is ever evaluated
+        with pytest.raises(TransformationError, match="Disallowed attribute"):
+            SafeEvaluator.compile_lambda("lambda: ().__class__.__bases__")
+    
+    def test_bound_lambda_matches_evaluate_compiled(self):
+        """Test that bound lambdas read the item currently bound in the globals."""
+        safe_globals = SafeEvaluator._get_globals()
+        # A bare lambda and one with defaults (re-evaluated per call)
+        for source in ("lambda: item['n'] * 2", "lambda n=2: item['n'] * n"):
+            code = SafeEvaluator.compile_lambda(source)
+            func = SafeEvaluator.bind_compiled(code)
+            
+            for item in ({"n": 1}, {"n": 5}):
+                safe_globals['item'] = item
+                result = func()
+                assert result == SafeEvaluator.evaluate_compiled(code, item) == item["n"] * 2
+    
+    def test_custom_function_results_and_failures(self, caplog):
+        """Test that each custom function's result or failure is kept per item."""
+        functions = {
+            "double": "lambda: item['n'] * 2",
+            "missing": "lambda: item['missing']",
+            "squares": "lambda: [i * item['n'] for i in range(3)]"
+        }
+        transformer = DataTransformer(TransformerConfig(custom_functions=functions))
+        
+        transformed = transformer.transform_data([{"n": 1}, {"n": 4}])
+        
+        assert transformed == [
+            {"n": 1, "double": 2, "missing": None, "squares": [0, 1, 2]},
+            {"n": 4, "double": 8, "missing": None, "squares": [0, 4, 8]}
+        ]
+        assert "Custom function 'missing' failed: Failed to evaluate lambda: 'missing'" in caplog.text
+    
+    def test_transform_item_matches_staged_pipeline(self):
+        """Test that the fused item transform matches the three separate stages."""
+        config = TransformerConfig(
+            field_mapping={"raw_count": "count", "raw_name": "name"},
+            type_conversions={"count": "int", "score": "float"},
+            custom_functions={
+                "double": "lambda: item.get('count', 0) * 2",
+                "sees_double": "lambda: 'double' in item"
+            }
+        )
+        transformer = DataTransformer(config)
+        item = {"raw_name": "a", "raw_count": "21", "score": "1.5", "extra": None}
+        
+        staged = transformer._apply_custom_functions(
+            transformer._apply_type_conversions(
+                transformer._apply_field_mapping(item, config.field_mapping),
+                config.type_conversions
+            ),
+            config.custom_functions
+        )
+        fused = transformer._transform_item(item, config)
+        
+        assert list(fused.items()) == list(staged.items())
+        assert fused["double"] == 42
+        assert fused["sees_double"] is False
+        assert item == {"raw_name": "a", "raw_count": "21", "score": "1.5", "extra": None}
+    
+    def test_transform_data_columnar_matches_per_item(self, sample_items):
+        """Test that the columnar path produces the same items as transform_data."""
+        transformer = DataTransformer()
+        config = TransformerConfig(
+            field_mapping={"quote_text": "text", "quote_author": "author"},
+            type_conversions={
+                "text": "string", "quote_tags": "array", "score": "int", "ratio": "float", "flag": "bool"
+            }
+        )
+        items = [
+            {**item, "score": str(i * 1.5), "ratio": str(i / 3), "flag": ["Yes", 0, None][i]}
+            for i, item in enumerate(sample_items)
+        ]
+        
+        expected = transformer.transform_data(items, config)
+        result = transformer.transform_data_columnar(items, config)
+        
+        assert result == expected
+        assert list(result[0]) == list(expected[0])
+        
+        # Heterogeneous items fall back to the per-item path
+        mixed = [{"quote_text": "a"}, {"score": "2"}]
+        assert transformer.transform_data_columnar(mixed, config) == transformer.transform_data(mixed, config)
+    
+    def test_transform_data_parallel_matches_sequential(self, sample_items, transformer_config):
+        """Test that chunked worker-process transformation keeps results and order."""
+        transformer = DataTransformer(transformer_config)
+        items = sample_items * 3
+        
+        expected = transformer.transform_data(items)
+        result = transformer.transform_data_parallel(items, workers=2, chunk_size=2)
+        
+        assert result == expected
+        assert transformer.transform_data_parallel([], workers=2) == []
+    
     def test_add_remove_custom_function(self):
         """Test adding and removing custom functions."""
         transformer = DataTransformer()
@@ -225,6 +345,14 @@ class TestDataTransformer:
             assert "new_text" in item
             assert "quote_text" not in item
     
+    def test_rename_only_batch_keeps_unmappable_items(self):
+        """Test that a rename-only batch keeps items it can't map unchanged."""
+        transformer = DataTransformer(TransformerConfig(field_mapping={"a": "b"}))
+        
+        transformed = transformer.transform_data([{"a": 1, "c": 2}, None])
+        
+        assert transformed == [{"b": 1, "c": 2}, None]
+    
     def test_custom_function_error_handling(self):
         """Test custom function error handling."""
         transformer = DataTransformer()
@@ -256,7 +384,12 @@ class TestDataTransformer:
             result = transformer._convert_type(date_str, "datetime")
             # Should return datetime object or original string if parsing fails
             assert hasattr(result, 'year') or isinstance(result, str)
-    
+        
+        # ISO fast path and the strptime fallback agree on exact values
+        assert transformer._convert_type("2024-01-15T10:30:00", "datetime") == datetime(2024, 1, 15, 10, 30)
+        assert transformer._convert_type("2024-1-5", "datetime") == datetime(2024, 1, 5)
+        assert transformer._convert_type("2024-01-15T10:30:00Z", "datetime") == "2024-01-15T10:30:00Z"
+
     def test_dict_conversion(self):
         """Test dictionary type conversion."""
         transformer = DataTransformer()
@@ -271,6 +404,15 @@ class TestDataTransformer:
         result = transformer._convert_type("simple_string", "dict")
         assert isinstance(result, dict)
         assert result["value"] == "simple_string"
+    
+    def test_json_conversion_accepts_what_json_does(self):
+        """Test that JSON orjson rejects is still parsed by the json fallback."""
+        transformer = DataTransformer()
+        
+        result = transformer._convert_type('{"a": NaN, "b": Infinity}', "dict")
+        assert result["a"] != result["a"]
+        assert result["b"] == float("inf")
+        assert transformer._convert_type('[1, NaN]', "array")[0] == 1
 
 
 if __name__ == "__main__":
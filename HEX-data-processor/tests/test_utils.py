@@ -0,0 +1,27 @@
+"""
+Tests for utility functions.
+"""
+
+import pytest
+
+from src.utils import generate_hash
+
+
+class TestGenerateHash:
+    """Test content hashing."""
+    
+    def test_dict_digest_is_stable(self):
+        """Test that dict digests match the json.dumps(sort_keys=True) form."""
+        content = {"b": [1, 2 ** 70], "a": "é"}
+        
+        assert generate_hash(content) == "8d1b556cb107280ab0cc27ec46d1d6f0"
+        assert generate_hash({"a": "é", "b": [1, 2 ** 70]}) == generate_hash(content)
+    
+    def test_unsupported_algorithm(self):
+        """Test that unknown algorithms are rejected."""
+        with pytest.raises(ValueError):
+            generate_hash("text", algorithm="crc32")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])